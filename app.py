@@ -1,22 +1,63 @@
 import os
+import re
+import json
+from bisect import bisect_left
+from itertools import accumulate, groupby
 import logging
 import secrets
-import base64
+import shutil
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from werkzeug.security import generate_password_hash, check_password_hash
-from flask import Flask, render_template, redirect, url_for, request, flash, jsonify, session
-from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase
-from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
+from flask import Flask, render_template, redirect, url_for, request, flash, jsonify, session, make_response, send_file, g, has_request_context
+from sqlalchemy import bindparam, case, delete, event, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+from flask_login import LoginManager, login_user, login_required, logout_user, current_user
 from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.utils import secure_filename
 import uuid
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+from extensions import cache, db
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# orjson serialises the slot lists several times faster than the stdlib
+# encoder and handles datetimes natively; fall back to json when missing.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Database setup
-class Base(DeclarativeBase):
-    pass
+# Configure logging - LOG_LEVEL wins, otherwise debug output only in development
+logging.basicConfig(level=os.environ.get(
+    'LOG_LEVEL', 'DEBUG' if os.environ.get('FLASK_ENV') == 'development' else 'INFO'
+).upper())
+
+# Password hashing cost. Werkzeug's default KDF takes a few hundred ms per
+# hash on the request thread; pbkdf2 at 120k iterations keeps register and
+# password changes responsive. Existing hashes still verify since
+# check_password_hash reads the method from the stored hash.
+PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:120000')
+
+def _password_hash_strength(method):
+    # Orders werkzeug method strings such as 'pbkdf2:sha256:600000' or
+    # 'scrypt:32768:8:1': plain salted digests from old werkzeug versions,
+    # then pbkdf2 by iterations, then scrypt by its cost factor
+    family, *params = method.split(':')
+    if family == 'pbkdf2':
+        return (1, int(params[1]) if len(params) > 1 else 0)
+    if family == 'scrypt':
+        return (2, int(params[0]) if params else 0)
+    return (0, 0)
+
+# Strength of hashes made with PASSWORD_HASH_METHOD, with werkzeug's defaults
+# filled in; login re-hashes passwords stored under anything weaker, and
+# leaves stronger hashes (e.g. werkzeug's 600k-iteration default) alone
+PASSWORD_HASH_STRENGTH = _password_hash_strength(
+    generate_password_hash('', method=PASSWORD_HASH_METHOD).split('$', 1)[0]
+)
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -32,35 +73,143 @@ try:
 except OSError as e:
     app.logger.error(f"Error creating instance folder at {app.instance_path}: {e}")
 
+# Upload folders, plus the rendered-certificate cache (kept under the instance
+# folder rather than static/ so certificates are only reachable through the
+# access-checked download route). Created once here instead of on every upload.
+ID_PHOTO_DIR = 'static/uploads/id_photos'
+FACE_PHOTO_DIR = 'static/uploads/face_photos'
+CERTIFICATE_CACHE_DIR = os.path.join(app.instance_path, 'certificates')
+for folder in (ID_PHOTO_DIR, FACE_PHOTO_DIR, CERTIFICATE_CACHE_DIR):
+    try:
+        os.makedirs(folder, exist_ok=True)
+    except OSError as e:
+        app.logger.error(f"Error creating folder at {folder}: {e}")
+
 # Add template filters
+DEFAULT_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+PRETTY_DATETIME_FORMAT = '%d %b %Y, %H:%M'
+
 @app.template_filter('strftime')
 def _jinja2_filter_datetime(date, fmt=None):
-    if fmt:
-        return date.strftime(fmt)
-    else:
-        return date.strftime('%Y-%m-%d %H:%M:%S')
+    return date.strftime(fmt or DEFAULT_DATETIME_FORMAT)
 
 @app.template_filter('datetime')
 def _jinja2_filter_pretty_datetime(date, fmt=None):
-    if fmt:
-        return date.strftime(fmt)
-    else:
-        return date.strftime('%d %b %Y, %H:%M')
+    return date.strftime(fmt or PRETTY_DATETIME_FORMAT)
+
+# Also exposed as a global so long listings can call {{ fmt_dt(value) }}
+# directly instead of going through the filter pipeline
+app.jinja_env.globals['fmt_dt'] = _jinja2_filter_pretty_datetime
 
 # Database configuration
 # Construct the SQLite path using app.instance_path for Render compatibility
 sqlite_db_path = os.path.join(app.instance_path, 'local_test.db')
 app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{sqlite_db_path}"
-app.logger.info(f"SQLite database URI set to: {app.config['SQLALCHEMY_DATABASE_URI']}")
 
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# Each gunicorn sync worker (see gunicorn.conf.py) serves one request at a
+# time, so a handful of pooled connections per process is plenty. A short
+# pool_timeout makes requests beyond that cap fail fast instead of piling up
+# behind SQLite's single writer. Sizes can be raised per deployment (e.g. a
+# threaded server or a networked database) without a code change.
 app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
     'pool_pre_ping': True,
-    "pool_recycle": 300,
+    # Pooled connections are reused for up to 30 minutes; each reconnect
+    # re-runs the SQLite PRAGMAs below
+    "pool_recycle": int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+    "pool_size": int(os.environ.get('DB_POOL_SIZE', 5)),
+    "max_overflow": int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+    "pool_timeout": int(os.environ.get('DB_POOL_TIMEOUT', 2)),
 }
 
+# In development, list-view queries raise on any relationship they didn't
+# eager-load (see _list_options), so a template that starts touching a new
+# relationship fails loudly instead of quietly adding a query per row
+app.config['STRICT_LAZY_LOAD'] = os.environ.get(
+    'STRICT_LAZY_LOAD', '1' if os.environ.get('FLASK_ENV') == 'development' else '0'
+) == '1'
+
 # Init SQLAlchemy
-db = SQLAlchemy(app, model_class=Base)
+db.init_app(app)
+
+# SimpleCache is per process, so with several gunicorn workers a badge can
+# lag by up to the memoize timeout; point CACHE_TYPE/CACHE_REDIS_URL at a
+# shared Redis to avoid that
+app.config['CACHE_TYPE'] = os.environ.get('CACHE_TYPE', 'SimpleCache')
+if os.environ.get('CACHE_REDIS_URL'):
+    app.config['CACHE_REDIS_URL'] = os.environ['CACHE_REDIS_URL']
+cache.init_app(app)
+
+# SQLite tuning applied to every new connection: WAL lets dashboard reads run
+# alongside form writes, and synchronous=NORMAL only fsyncs on checkpoint
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+# Only for SQLite; another SQLALCHEMY_DATABASE_URI gets its own tuning
+with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, "connect", _set_sqlite_pragmas)
+
+# In development every response reports how many SQL statements it ran in an
+# X-SQL-Count header, and requests over SQL_QUERY_BUDGET log a warning, so a
+# new N+1 shows up as soon as a page is opened. The same statement running
+# more than SQL_REPEAT_LIMIT times in one request is the N+1 signature itself
+# (a lazy load per row); with SQL_REPEAT_RAISE that raises at the offending
+# query, so the route fails in development and in tests
+app.config['SQL_QUERY_COUNT'] = os.environ.get(
+    'SQL_QUERY_COUNT', '1' if os.environ.get('FLASK_ENV') == 'development' else '0'
+) == '1'
+app.config['SQL_REPEAT_RAISE'] = os.environ.get(
+    'SQL_REPEAT_RAISE', '1' if os.environ.get('FLASK_ENV') == 'development' else '0'
+) == '1'
+SQL_QUERY_BUDGET = int(os.environ.get('SQL_QUERY_BUDGET', 10))
+SQL_REPEAT_LIMIT = int(os.environ.get('SQL_REPEAT_LIMIT', 3))
+
+# The same SQL statement ran more than SQL_REPEAT_LIMIT times in one request
+class RepeatedQueryError(RuntimeError):
+    pass
+
+def _count_sql_statement(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        g.sql_count = g.get('sql_count', 0) + 1
+        statements = g.setdefault('sql_statements', Counter())
+        statements[statement] += 1
+        if statements[statement] == SQL_REPEAT_LIMIT + 1:
+            if app.config['SQL_REPEAT_RAISE']:
+                raise RepeatedQueryError(f"{request.path} repeated a query: {statement}")
+            app.logger.warning("%s %s repeated a query more than %d times: %s",
+                               request.method, request.path, SQL_REPEAT_LIMIT, statement)
+
+def _report_sql_count(response):
+    sql_count = g.get('sql_count', 0)
+    response.headers['X-SQL-Count'] = str(sql_count)
+    if sql_count > SQL_QUERY_BUDGET:
+        app.logger.warning("%s %s ran %d SQL statements (budget %d)",
+                           request.method, request.path, sql_count, SQL_QUERY_BUDGET)
+    return response
+
+if app.config['SQL_QUERY_COUNT']:
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", _count_sql_statement)
+    app.after_request(_report_sql_count)
+
+from models import (
+    User, ResidentInfo, LeaderInfo, PoliceInfo, AddressApplication, Appointment,
+    WeeklySchedule, ScheduledBreak, AvailableTimeSlot, AddressCertificate,
+    PENDING_STATUSES
+)
 
 # Initialize Flask-Login
 login_manager = LoginManager()
@@ -70,20 +219,164 @@ login_manager.login_view = 'login'
 # User loader for Flask-Login
 @login_manager.user_loader
 def load_user(user_id):
-    from models import User
-    return User.query.get(int(user_id))
+    # Pull the one-to-one profile rows in with the user so role checks and
+    # current_user.leader_info / police_info don't each cost another SELECT
+    return db.session.get(
+        User, int(user_id),
+        options=[joinedload(User.leader_info), joinedload(User.police_info)]
+    )
+
+# Per-role routing tables, keyed by User.userType
+_DASHBOARD_ENDPOINT = {
+    'resident': 'resident_dashboard',
+    'leader': 'leader_dashboard',
+    'police': 'police_dashboard',
+}
+_FORM_ENDPOINT = {
+    'resident': 'resident_form',
+    'leader': 'leader_form',
+    'police': 'police_form',
+}
+_PENDING_APPROVAL_MESSAGE = {
+    'leader': 'Your leader account is pending approval.',
+    'police': 'Your police officer account is pending approval.',
+}
+
+_DUPLICATE_SCHEDULE_MESSAGE = 'You already have a schedule for this day. Please delete the existing schedule first.'
+
+# WeeklySchedule.day_of_week names, 0=Monday
+DAYS_OF_WEEK = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Interview slots are 30 minutes with a 15-minute gap between generated
+# slots; booking one also blocks the officer's slots starting within 15
+# minutes of its end
+INTERVIEW_DURATION = timedelta(minutes=30)
+SLOT_GAP = timedelta(minutes=15)
+BOOKING_BUFFER = timedelta(minutes=15)
+
+# Filter for applications that are still in progress. The statuses are
+# rendered inline rather than as bound parameters, so SQLite can match the
+# query against the ix_app_applicant_pending partial index.
+_IS_PENDING = AddressApplication.status.in_(
+    bindparam('pending_statuses', PENDING_STATUSES, expanding=True, literal_execute=True)
+)
+
+# Basic shape check for addresses typed into forms (one @, a dot in the domain)
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+def _new_certificate_number():
+    # 48-bit millisecond timestamp + 16 random bits: numbers sort by issue
+    # time (so inserts append to the unique index) and, unlike 8 hex digits
+    # of a uuid4, don't start colliding after tens of thousands of certificates
+    return f"AM-{time.time_ns() // 1_000_000:012X}{secrets.randbits(16):04X}"
+
+def current_leader_info():
+    # The logged-in user's LeaderInfo. load_user already joins it onto
+    # current_user, so every caller in a request shares that one row
+    # instead of issuing its own SELECT.
+    return current_user.leader_info
+
+def current_police_info():
+    # The logged-in user's PoliceInfo, shared the same way
+    return current_user.police_info
+
+def current_resident_info():
+    # The logged-in user's ResidentInfo; User.resident_info is always joined
+    return current_user.resident_info
+
+@cache.memoize(timeout=30)
+def _cached_pending_applications_count():
+    return AddressApplication.query.filter_by(status='pending').count()
+
+def _pending_applications_count():
+    # Notification badge count for leader pages. It only needs to be roughly
+    # current, so the COUNT is shared across requests for up to 30 seconds and
+    # dropped early whenever an application enters or leaves 'pending'
+    if 'pending_applications_count' not in g:
+        g.pending_applications_count = _cached_pending_applications_count()
+    return g.pending_applications_count
+
+def _pending_applications_changed():
+    # Call after committing a change that adds or removes a pending application
+    cache.delete_memoized(_cached_pending_applications_count)
+
+def _list_options(*options):
+    # Loader options for list-view queries, plus raiseload('*') under
+    # STRICT_LAZY_LOAD
+    if app.config['STRICT_LAZY_LOAD']:
+        return (*options, raiseload('*'))
+    return options
+
+def _safe_int(value, default=1):
+    # Form numbers such as wardNumber fall back to a default instead of failing
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+# Plain text fields each registration form copies straight onto its info model
+_RESIDENT_FORM_FIELDS = ('firstName', 'lastName', 'idNumber', 'phoneNumber', 'settlement',
+                         'unitNumber', 'postalCode', 'municipality', 'councillorName')
+_LEADER_FORM_FIELDS = ('firstName', 'lastName', 'idNumber', 'phoneNumber', 'municipality',
+                       'officeLocation', 'settlement', 'unitNumber', 'postalCode')
+_POLICE_FORM_FIELDS = ('firstName', 'lastName', 'phoneNumber', 'badgeNumber', 'rank',
+                       'stationName', 'municipality', 'postalCode')
+
+# Fields the profile settings forms edit on the info models
+_PERSONAL_INFO_FIELDS = ('firstName', 'lastName', 'phoneNumber')
+_LEADER_OFFICE_FIELDS = ('municipality', 'officeLocation', 'settlement', 'unitNumber', 'postalCode')
+_POLICE_PROFILE_FIELDS = ('firstName', 'lastName', 'phoneNumber', 'rank', 'stationName')
+
+def _form_fields(names):
+    # One copy of the posted form, then plain dict lookups with '' defaults
+    form = request.form.to_dict()
+    return form, {name: form.get(name, '') for name in names}
+
+def _populate_obj(obj, fields):
+    # Copy form fields onto a model instance by attribute name
+    for name, value in fields.items():
+        setattr(obj, name, value)
+
+def _save_info(model, existing_info, fields):
+    # Update the user's existing info row in place, or add a new one
+    if existing_info:
+        _populate_obj(existing_info, fields)
+    else:
+        existing_info = model(user_id=current_user.id, **fields)
+        db.session.add(existing_info)
+    
+    # Store the ID photo path (in a real app, would handle file upload)
+    existing_info.idPhotoPath = '/static/uploads/id_photos/demo_id.jpg'
+
+def _render_public_page(template):
+    # Anonymous GETs of the landing/auth pages have no per-user content, so
+    # let browsers and proxies reuse them briefly and revalidate by ETag.
+    # Pages with pending flash messages are one-off and stay uncached; the
+    # session lookup also makes Flask send Vary: Cookie, so a cached copy
+    # is never reused once the visitor logs in.
+    response = make_response(render_template(template))
+    if request.method != 'GET' or current_user.is_authenticated or session.get('_flashes'):
+        return response
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    response.add_etag()
+    return response.make_conditional(request)
+
+@app.context_processor
+def _inject_pending_applications_count():
+    # Leader templates all show the pending-applications badge. Views that
+    # already counted pending applications leave the number on g, so this
+    # only queries when the view didn't.
+    if current_user.is_authenticated and current_user.userType == 'leader':
+        return {'pending_applications_count': _pending_applications_count()}
+    return {}
 
 # Basic routes
 @app.route('/')
 def index():
-    if current_user.is_authenticated:
-        if current_user.userType == 'resident':
-            return redirect(url_for('resident_dashboard'))
-        elif current_user.userType == 'leader':
-            return redirect(url_for('leader_dashboard'))
-        elif current_user.userType == 'police':
-            return redirect(url_for('police_dashboard'))
-    return render_template('index.html')
+    if current_user.is_authenticated and current_user.userType in _DASHBOARD_ENDPOINT:
+        return redirect(url_for(_DASHBOARD_ENDPOINT[current_user.userType]))
+    return _render_public_page('index.html')
 
 @app.route('/register', methods=['GET', 'POST'])
 def register():
@@ -94,14 +387,12 @@ def register():
         userType = request.form.get('userType')
         
         # Check if user already exists
-        from models import User
-        existing_user = User.query.filter_by(email=email).first()
-        if existing_user:
+        if db.session.scalar(select(User.id).filter_by(email=email).limit(1)):
             flash('An account with this email already exists.', 'danger')
             return render_template('register.html')
         
         # Create new user
-        hashed_password = generate_password_hash(password)
+        hashed_password = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
         new_user = User(fullName=fullName, email=email, password=hashed_password, userType=userType)
         
         try:
@@ -112,17 +403,13 @@ def register():
             login_user(new_user)
             
             # Redirect based on user type
-            if userType == 'resident':
-                return redirect(url_for('resident_form'))
-            elif userType == 'leader':
-                return redirect(url_for('leader_form'))
-            elif userType == 'police':
-                return redirect(url_for('police_form'))
+            if userType in _FORM_ENDPOINT:
+                return redirect(url_for(_FORM_ENDPOINT[userType]))
         except Exception as e:
             db.session.rollback()
             flash(f'Registration failed: {str(e)}', 'danger')
     
-    return render_template('register.html')
+    return _render_public_page('register.html')
 
 @app.route('/resident_form', methods=['GET', 'POST'])
 @login_required
@@ -133,67 +420,26 @@ def resident_form():
         return redirect(url_for('index'))
     
     if request.method == 'POST':
-        from models import ResidentInfo, AddressApplication
-        
         try:
             # Get form data with defaults to prevent errors
-            firstName = request.form.get('firstName', '')
-            lastName = request.form.get('lastName', '')
-            idNumber = request.form.get('idNumber', '')
-            phoneNumber = request.form.get('phoneNumber', '')
-            settlement = request.form.get('settlement', '')
-            unitNumber = request.form.get('unitNumber', '')
-            postalCode = request.form.get('postalCode', '')
-            isOwner = True if request.form.get('isOwner') == 'yes' else False
-            municipality = request.form.get('municipality', '')
-            wardNumber = request.form.get('wardNumber', '1')
-            councillorName = request.form.get('councillorName', '')
-            
-            # Check if resident info already exists
-            existing_info = ResidentInfo.query.filter_by(user_id=current_user.id).first()
-            
-            if existing_info:
-                # Update existing record
-                existing_info.firstName = firstName
-                existing_info.lastName = lastName
-                existing_info.idNumber = idNumber
-                existing_info.phoneNumber = phoneNumber
-                existing_info.settlement = settlement
-                existing_info.unitNumber = unitNumber
-                existing_info.postalCode = postalCode
-                existing_info.isOwner = isOwner
-                existing_info.municipality = municipality
-                try:
-                    existing_info.wardNumber = int(wardNumber)
-                except ValueError:
-                    existing_info.wardNumber = 1
-                existing_info.councillorName = councillorName
-                existing_info.idPhotoPath = '/static/uploads/id_photos/demo_id.jpg'
-            else:
-                # Create new resident info
-                resident_info = ResidentInfo(
-                    user_id=current_user.id,
-                    firstName=firstName,
-                    lastName=lastName,
-                    idNumber=idNumber,
-                    phoneNumber=phoneNumber,
-                    settlement=settlement,
-                    unitNumber=unitNumber,
-                    postalCode=postalCode,
-                    isOwner=isOwner,
-                    municipality=municipality,
-                    wardNumber=int(wardNumber) if wardNumber.isdigit() else 1,
-                    councillorName=councillorName
-                )
-                db.session.add(resident_info)
-                
-                # Store the ID photo path (in a real app, would handle file upload)
-                resident_info.idPhotoPath = '/static/uploads/id_photos/demo_id.jpg'
-            
-            # Check if application already exists
-            existing_application = AddressApplication.query.filter_by(applicant_id=current_user.id).first()
-            
-            if not existing_application:
+            form, fields = _form_fields(_RESIDENT_FORM_FIELDS)
+            fields['isOwner'] = form.get('isOwner') == 'yes'
+            fields['wardNumber'] = _safe_int(form.get('wardNumber', '1'))
+            
+            # Fetch any existing resident info, and whether an application
+            # exists, in a single query
+            existing_info, has_application = db.session.query(
+                ResidentInfo,
+                select(AddressApplication.id).where(
+                    AddressApplication.applicant_id == User.id
+                ).exists()
+            ).select_from(User).outerjoin(
+                ResidentInfo, ResidentInfo.user_id == User.id
+            ).filter(User.id == current_user.id).first()
+            
+            _save_info(ResidentInfo, existing_info, fields)
+            
+            if not has_application:
                 # Create address application
                 application = AddressApplication(
                     applicant_id=current_user.id,
@@ -203,12 +449,14 @@ def resident_form():
             
             # Commit all changes
             db.session.commit()
+            if not has_application:
+                _pending_applications_changed()
             
             # Always redirect to verification after successful submission
             return redirect(url_for('verification'))
         except Exception as e:
             db.session.rollback()
-            print(f"Error in resident_form: {str(e)}")
+            app.logger.exception("Error in resident_form")
             flash(f'Error saving information: {str(e)}', 'danger')
             # Despite error, proceed to verification for the demo
             return redirect(url_for('verification'))
@@ -224,59 +472,14 @@ def leader_form():
         return redirect(url_for('index'))
     
     if request.method == 'POST':
-        from models import LeaderInfo
-        
         try:
             # Get form data with defaults to prevent errors
-            firstName = request.form.get('firstName', '')
-            lastName = request.form.get('lastName', '')
-            idNumber = request.form.get('idNumber', '')
-            phoneNumber = request.form.get('phoneNumber', '')
-            municipality = request.form.get('municipality', '')
-            wardNumber = request.form.get('wardNumber', '1')
-            officeLocation = request.form.get('officeLocation', '')
-            settlement = request.form.get('settlement', '')
-            unitNumber = request.form.get('unitNumber', '')
-            postalCode = request.form.get('postalCode', '')
+            form, fields = _form_fields(_LEADER_FORM_FIELDS)
+            fields['wardNumber'] = _safe_int(form.get('wardNumber', '1'))
             
             # Check if leader info already exists
-            existing_info = LeaderInfo.query.filter_by(user_id=current_user.id).first()
-            
-            if existing_info:
-                # Update existing record
-                existing_info.firstName = firstName
-                existing_info.lastName = lastName
-                existing_info.idNumber = idNumber
-                existing_info.phoneNumber = phoneNumber
-                existing_info.municipality = municipality
-                try:
-                    existing_info.wardNumber = int(wardNumber)
-                except ValueError:
-                    existing_info.wardNumber = 1
-                existing_info.officeLocation = officeLocation
-                existing_info.settlement = settlement
-                existing_info.unitNumber = unitNumber
-                existing_info.postalCode = postalCode
-                existing_info.idPhotoPath = '/static/uploads/id_photos/demo_id.jpg'
-            else:
-                # Create new leader info
-                leader_info = LeaderInfo(
-                    user_id=current_user.id,
-                    firstName=firstName,
-                    lastName=lastName,
-                    idNumber=idNumber,
-                    phoneNumber=phoneNumber,
-                    municipality=municipality,
-                    wardNumber=int(wardNumber) if wardNumber.isdigit() else 1,
-                    officeLocation=officeLocation,
-                    settlement=settlement,
-                    unitNumber=unitNumber,
-                    postalCode=postalCode
-                )
-                db.session.add(leader_info)
-                
-                # Store the ID photo path (in a real app, would handle file upload)
-                leader_info.idPhotoPath = '/static/uploads/id_photos/demo_id.jpg'
+            existing_info = current_leader_info()
+            _save_info(LeaderInfo, existing_info, fields)
             
             # Commit all changes
             db.session.commit()
@@ -285,7 +488,7 @@ def leader_form():
             return redirect(url_for('verification'))
         except Exception as e:
             db.session.rollback()
-            print(f"Error in leader_form: {str(e)}")
+            app.logger.exception("Error in leader_form")
             flash(f'Error saving information: {str(e)}', 'danger')
             # Despite error, proceed to verification for the demo
             return redirect(url_for('verification'))
@@ -301,54 +504,15 @@ def police_form():
         return redirect(url_for('index'))
     
     if request.method == 'POST':
-        from models import PoliceInfo
-        
         try:
             # Get form data with defaults to prevent errors
-            firstName = request.form.get('firstName', '')
-            lastName = request.form.get('lastName', '')
+            _, fields = _form_fields(_POLICE_FORM_FIELDS)
             # idNumber is no longer required for police officers
-            idNumber = "Not Required"  # Default value since field is not in the form
-            phoneNumber = request.form.get('phoneNumber', '')
-            badgeNumber = request.form.get('badgeNumber', '')
-            rank = request.form.get('rank', '')
-            stationName = request.form.get('stationName', '')
-            municipality = request.form.get('municipality', '')
-            postalCode = request.form.get('postalCode', '')
+            fields['idNumber'] = "Not Required"  # Default value since field is not in the form
             
             # Check if police info already exists
-            existing_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
-            
-            if existing_info:
-                # Update existing record
-                existing_info.firstName = firstName
-                existing_info.lastName = lastName
-                existing_info.idNumber = idNumber
-                existing_info.phoneNumber = phoneNumber
-                existing_info.badgeNumber = badgeNumber
-                existing_info.rank = rank
-                existing_info.stationName = stationName
-                existing_info.municipality = municipality
-                existing_info.postalCode = postalCode
-                existing_info.idPhotoPath = '/static/uploads/id_photos/demo_id.jpg'
-            else:
-                # Create new police info
-                police_info = PoliceInfo(
-                    user_id=current_user.id,
-                    firstName=firstName,
-                    lastName=lastName,
-                    idNumber=idNumber,
-                    phoneNumber=phoneNumber,
-                    badgeNumber=badgeNumber,
-                    rank=rank,
-                    stationName=stationName,
-                    municipality=municipality,
-                    postalCode=postalCode
-                )
-                db.session.add(police_info)
-                
-                # Store the ID photo path (in a real app, would handle file upload)
-                police_info.idPhotoPath = '/static/uploads/id_photos/demo_id.jpg'
+            existing_info = current_police_info()
+            _save_info(PoliceInfo, existing_info, fields)
             
             # Commit all changes
             db.session.commit()
@@ -357,7 +521,7 @@ def police_form():
             return redirect(url_for('verification'))
         except Exception as e:
             db.session.rollback()
-            print(f"Error in police_form: {str(e)}")
+            app.logger.exception("Error in police_form")
             flash(f'Error saving information: {str(e)}', 'danger')
             # Despite error, proceed to verification for the demo
             return redirect(url_for('verification'))
@@ -380,9 +544,8 @@ def verification():
                 current_user.isVerified = True
                 
                 # If there's a resident_info record, store the face photo path
-                resident_info_record = current_user.resident_info.first() # Get the first ResidentInfo record
-                if resident_info_record:
-                    resident_info_record.facePhotoPath = '/static/uploads/face_photos/demo_face.jpg'
+                if current_user.resident_info:
+                    current_user.resident_info.facePhotoPath = '/static/uploads/face_photos/demo_face.jpg'
             
             elif current_user.userType == 'leader':
                 # Leaders need approval - set to not verified initially
@@ -406,10 +569,10 @@ def verification():
             
             db.session.commit()
             
-            print(f"User {current_user.id} verification processing complete")
+            app.logger.debug("User %s verification processing complete", current_user.id)
             return redirect(url_for('confirmation'))
         except Exception as e:
-            print(f"Error in verification: {str(e)}")
+            app.logger.exception("Error in verification")
             # For demo only, still proceed to confirmation
             return redirect(url_for('confirmation'))
     
@@ -428,16 +591,15 @@ def confirmation():
     }
     
     # Get additional info based on user type
-    if current_user.userType == 'resident':
-        info = current_user.resident_info.first() # Fetch the actual ResidentInfo object
-        if info: # Check if info is not None
-            user_data.update({
-                'firstName': info.firstName,
-                'lastName': info.lastName,
-                'idNumber': info.idNumber,
-                'settlement': info.settlement,
-                'municipality': info.municipality
-            })
+    if current_user.userType == 'resident' and current_user.resident_info:
+        info = current_user.resident_info
+        user_data.update({
+            'firstName': info.firstName,
+            'lastName': info.lastName,
+            'idNumber': info.idNumber,
+            'settlement': info.settlement,
+            'municipality': info.municipality
+        })
     elif current_user.userType == 'leader' and current_user.leader_info:
         info = current_user.leader_info
         user_data.update({
@@ -470,43 +632,40 @@ def login():
         password = request.form.get('loginPassword')
         
         # Find user by email
-        from models import User
         user = User.query.filter_by(email=email).first()
         
         if user and check_password_hash(user.password, password):
+            # Upgrade hashes weaker than the current profile while the
+            # plaintext is at hand
+            if _password_hash_strength(user.password.split('$', 1)[0]) < PASSWORD_HASH_STRENGTH:
+                user.password = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+                db.session.commit()
+            
             # Login successful
             login_user(user)
             
             # Generate and store a "2FA code" (for demo purposes)
             # In a real app, this would be sent via SMS/email
-            twofa_code = ''.join([str(secrets.randbelow(10)) for _ in range(6)])
+            twofa_code = f"{secrets.randbelow(1_000_000):06d}"
             session['twofa_code'] = twofa_code
             
             # For demo, we'll just verify the code without actually sending it
             # In production, this would require a separate verification step
             
-            # Redirect based on user type and verification status
-            if user.userType == 'resident':
-                # Residents can access their dashboard
-                return redirect(url_for('resident_dashboard'))
-            elif user.userType == 'leader':
-                # Check if leader is approved
-                if user.leader_info and user.leader_info.isApproved:
-                    return redirect(url_for('leader_dashboard'))
-                else:
-                    flash('Your leader account is pending approval.', 'warning')
-                    return redirect(url_for('index'))
-            elif user.userType == 'police':
-                # Check if police officer is approved
-                if user.police_info and user.police_info.isApproved:
-                    return redirect(url_for('police_dashboard'))
-                else:
-                    flash('Your police officer account is pending approval.', 'warning')
+            # Leaders and police officers must be approved before reaching their dashboard
+            if user.userType in _PENDING_APPROVAL_MESSAGE:
+                profile = getattr(user, f'{user.userType}_info')
+                if not profile or not profile.isApproved:
+                    flash(_PENDING_APPROVAL_MESSAGE[user.userType], 'warning')
                     return redirect(url_for('index'))
+            
+            # Redirect based on user type
+            if user.userType in _DASHBOARD_ENDPOINT:
+                return redirect(url_for(_DASHBOARD_ENDPOINT[user.userType]))
         else:
             flash('Invalid email or password.', 'danger')
     
-    return render_template('login.html')
+    return _render_public_page('login.html')
 
 @app.route('/logout')
 @login_required
@@ -515,6 +674,37 @@ def logout():
     flash('You have been logged out.', 'info')
     return redirect(url_for('login'))
 
+def _load_resident_context(user):
+    # Shared by the resident dashboard, application status and my address pages.
+    # resident_info is joined onto the logged-in user already, so this is
+    # two queries: approved application + certificate, pending application
+    # + appointment.
+    approved_application, certificate = db.session.query(
+        AddressApplication, AddressCertificate
+    ).outerjoin(
+        AddressCertificate, AddressCertificate.application_id == AddressApplication.id
+    ).filter(
+        AddressApplication.applicant_id == user.id,
+        AddressApplication.status == 'approved'
+    ).order_by(AddressApplication.updated_at.desc()).first() or (None, None)
+    
+    pending_application, appointment = db.session.query(
+        AddressApplication, Appointment
+    ).outerjoin(
+        Appointment, Appointment.application_id == AddressApplication.id
+    ).filter(
+        AddressApplication.applicant_id == user.id,
+        _IS_PENDING
+    ).order_by(AddressApplication.created_at.desc()).first() or (None, None)
+    
+    return {
+        'resident_info': user.resident_info,
+        'approved_application': approved_application,
+        'pending_application': pending_application,
+        'appointment': appointment,
+        'certificate': certificate
+    }
+
 # Dashboard routes
 @app.route('/resident/dashboard')
 @login_required
@@ -523,43 +713,7 @@ def resident_dashboard():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import ResidentInfo, AddressApplication, Appointment, AddressCertificate
-    
-    # Get the resident's information
-    resident_info = ResidentInfo.query.filter_by(user_id=current_user.id).first()
-    
-    # Get the most recent approved application, if any
-    approved_application = AddressApplication.query.filter_by(
-        applicant_id=current_user.id,
-        status='approved'
-    ).order_by(AddressApplication.updated_at.desc()).first()
-    
-    # Get the certificate for the approved application, if any
-    certificate = None
-    if approved_application:
-        certificate = AddressCertificate.query.filter_by(
-            application_id=approved_application.id
-        ).first()
-    
-    # Check if there's a pending application
-    pending_application = AddressApplication.query.filter(
-        AddressApplication.applicant_id == current_user.id,
-        AddressApplication.status.in_(['pending', 'leader_approved', 'interview_scheduled', 'interview_completed'])
-    ).order_by(AddressApplication.created_at.desc()).first()
-    
-    # Get the most recent appointment, if any
-    appointment = None
-    if pending_application:
-        appointment = Appointment.query.filter_by(application_id=pending_application.id).first()
-    
-    return render_template(
-        'resident/dashboard.html',
-        resident_info=resident_info,
-        approved_application=approved_application,
-        pending_application=pending_application,
-        appointment=appointment,
-        certificate=certificate
-    )
+    return render_template('resident/dashboard.html', **_load_resident_context(current_user))
 
 @app.route('/resident/application-status')
 @login_required
@@ -568,43 +722,7 @@ def resident_application_status():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import ResidentInfo, AddressApplication, Appointment, AddressCertificate
-    
-    # Get the resident's information
-    resident_info = ResidentInfo.query.filter_by(user_id=current_user.id).first()
-    
-    # Get the most recent approved application, if any
-    approved_application = AddressApplication.query.filter_by(
-        applicant_id=current_user.id,
-        status='approved'
-    ).order_by(AddressApplication.updated_at.desc()).first()
-    
-    # Get the certificate for the approved application, if any
-    certificate = None
-    if approved_application:
-        certificate = AddressCertificate.query.filter_by(
-            application_id=approved_application.id
-        ).first()
-    
-    # Check if there's a pending application
-    pending_application = AddressApplication.query.filter(
-        AddressApplication.applicant_id == current_user.id,
-        AddressApplication.status.in_(['pending', 'leader_approved', 'interview_scheduled', 'interview_completed'])
-    ).order_by(AddressApplication.created_at.desc()).first()
-    
-    # Get the most recent appointment, if any
-    appointment = None
-    if pending_application:
-        appointment = Appointment.query.filter_by(application_id=pending_application.id).first()
-    
-    return render_template(
-        'resident/application_status.html',
-        resident_info=resident_info,
-        approved_application=approved_application,
-        pending_application=pending_application,
-        appointment=appointment,
-        certificate=certificate
-    )
+    return render_template('resident/application_status.html', **_load_resident_context(current_user))
 
 @app.route('/resident/schedule-interview', methods=['GET', 'POST'])
 @login_required
@@ -613,11 +731,8 @@ def resident_schedule_interview():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import ResidentInfo, AddressApplication, Appointment, AvailableTimeSlot, User, AddressCertificate
-    import uuid
-    
     # Get the resident's information
-    resident_info = ResidentInfo.query.filter_by(user_id=current_user.id).first()
+    resident_info = current_resident_info()
     
     # Check if there's a pending application with leader_approved status or any pending application
     leader_approved_application = AddressApplication.query.filter(
@@ -628,7 +743,7 @@ def resident_schedule_interview():
     # Get the most recent pending application regardless of status for displaying in the template
     any_pending_application = AddressApplication.query.filter(
         AddressApplication.applicant_id == current_user.id,
-        AddressApplication.status.in_(['pending', 'leader_approved', 'interview_scheduled', 'interview_completed'])
+        _IS_PENDING
     ).order_by(AddressApplication.created_at.desc()).first()
     
     # Can only schedule if the application status is leader_approved
@@ -645,9 +760,11 @@ def resident_schedule_interview():
         flash('You already have a scheduled interview.', 'info')
         return redirect(url_for('resident_application_status'))
     
-    # Handle GET request with location parameters to show specific location's slots
-    from datetime import datetime, timedelta
+    # One clock reading for the whole request, so every "future slots" filter
+    # below uses the same cutoff
+    now = datetime.now()
     
+    # Handle GET request with location parameters to show specific location's slots
     selected_location = None
     selected_slots = []
     
@@ -665,10 +782,18 @@ def resident_schedule_interview():
                 'postal_code': postal_code
             }
             
-            # Get available slots for the selected location
-            selected_slots = AvailableTimeSlot.query.filter(
+            # Get available slots for the selected location, loading only the
+            # columns the slot picker renders
+            selected_slots = AvailableTimeSlot.query.options(
+                load_only(
+                    AvailableTimeSlot.id,
+                    AvailableTimeSlot.start_time,
+                    AvailableTimeSlot.end_time,
+                    AvailableTimeSlot.officer_id
+                )
+            ).filter(
                 AvailableTimeSlot.is_booked == False,
-                AvailableTimeSlot.start_time > datetime.now(),
+                AvailableTimeSlot.start_time > now,
                 AvailableTimeSlot.municipality == municipality,
                 AvailableTimeSlot.station_name == station_name,
                 AvailableTimeSlot.postal_code == postal_code
@@ -685,9 +810,9 @@ def resident_schedule_interview():
             return redirect(url_for('resident_schedule_interview'))
         
         # Get the selected time slot
-        time_slot = AvailableTimeSlot.query.get(slot_id)
+        time_slot = db.session.get(AvailableTimeSlot, slot_id)
         
-        if not time_slot or time_slot.is_booked:
+        if not time_slot or not _claim_slot(time_slot.id):
             flash('The selected time slot is no longer available.', 'danger')
             return redirect(url_for('resident_schedule_interview'))
         
@@ -701,17 +826,14 @@ def resident_schedule_interview():
             status='completed'  # Auto-complete for testing
         )
         
-        # Mark the time slot as booked
-        time_slot.is_booked = True
-        
         # For testing: Auto-approve application (skip interview)
         pending_application.status = 'approved'
         pending_application.officer_id = time_slot.officer_id
         pending_application.officer_notes = "Auto-approved for testing purposes"
         
         # Create a certificate immediately for testing
-        certificate_number = f"AM-{uuid.uuid4().hex[:8].upper()}"
-        issue_date = datetime.now()
+        certificate_number = _new_certificate_number()
+        issue_date = now
         expiry_date = issue_date + timedelta(days=365)  # Valid for 1 year
         
         certificate = AddressCertificate(
@@ -727,6 +849,7 @@ def resident_schedule_interview():
             db.session.add(appointment)
             db.session.add(certificate)
             db.session.commit()
+            _location_slots_changed(time_slot)
             flash('Interview scheduled and automatically approved for testing! You may now download your address certificate.', 'success')
         except Exception as e:
             app.logger.error(f"Error booking interview: {str(e)}")
@@ -736,36 +859,32 @@ def resident_schedule_interview():
         return redirect(url_for('resident_application_status'))
     
     # GET request - show available time slots grouped by location
-    from datetime import datetime
-    from sqlalchemy import func
-    
-    # Get available time slots from police officers that are in the future
-    available_slots = AvailableTimeSlot.query.filter(
-        AvailableTimeSlot.is_booked == False,
-        AvailableTimeSlot.start_time > datetime.now()
-    ).order_by(AvailableTimeSlot.start_time).all()
-    
     # Get all unique locations where interviews are available
     # This is for location-based scheduling - users select a location first, not an officer
-    import logging
-    from sqlalchemy import func
-    
     try:
-        locations = db.session.query(
+        # Narrow to open future slots first, then group only that set
+        open_slots = db.session.query(
+            AvailableTimeSlot.id,
             AvailableTimeSlot.municipality,
             AvailableTimeSlot.station_name,
-            AvailableTimeSlot.postal_code,
-            func.count(AvailableTimeSlot.id).label('slot_count')
+            AvailableTimeSlot.postal_code
         ).filter(
             AvailableTimeSlot.is_booked == False,
-            AvailableTimeSlot.start_time > datetime.now(),
+            AvailableTimeSlot.start_time > now,
             AvailableTimeSlot.municipality != None,  # Ensure location data exists
             AvailableTimeSlot.station_name != None,
             AvailableTimeSlot.postal_code != None
+        ).subquery()
+        
+        locations = db.session.query(
+            open_slots.c.municipality,
+            open_slots.c.station_name,
+            open_slots.c.postal_code,
+            func.count(open_slots.c.id).label('slot_count')
         ).group_by(
-            AvailableTimeSlot.municipality,
-            AvailableTimeSlot.station_name,
-            AvailableTimeSlot.postal_code
+            open_slots.c.municipality,
+            open_slots.c.station_name,
+            open_slots.c.postal_code
         ).all()
         
         logging.info(f"Found {len(locations)} unique locations with available slots")
@@ -779,14 +898,18 @@ def resident_schedule_interview():
     # Officer identity is hidden until after booking for privacy and security
     # Just collect minimal required info
     if selected_slots:
+        # One WHERE IN lookup for every officer on the list instead of one per slot
+        try:
+            officer_names = dict(db.session.query(User.id, User.fullName).filter(
+                User.id.in_({slot.officer_id for slot in selected_slots})
+            ).all())
+        except Exception as e:
+            logging.error(f"Error getting officer info for selected slots: {str(e)}")
+            officer_names = {}
+        
         for slot in selected_slots:
-            try:
-                officer = User.query.get(slot.officer_id)
-                # We don't use officer name in the UI until after booking, so this is just for record keeping
-                slot.officer_name = officer.fullName if officer else "Unknown Officer"
-            except Exception as e:
-                logging.error(f"Error getting officer info for slot {slot.id}: {str(e)}")
-                slot.officer_name = "Unknown Officer"
+            # We don't use officer name in the UI until after booking, so this is just for record keeping
+            slot.officer_name = officer_names.get(slot.officer_id, "Unknown Officer")
     
     return render_template(
         'resident/schedule_interview.html',
@@ -806,10 +929,8 @@ def resident_proof_of_address():
         flash('Access denied. Only residents can view address certificates.', 'danger')
         return redirect(url_for('index'))
     
-    from models import ResidentInfo, AddressApplication, AddressCertificate
-    
     # Get the resident's information
-    resident_info = ResidentInfo.query.filter_by(user_id=current_user.id).first()
+    resident_info = current_resident_info()
     
     # Get the most recent approved application, if any
     approved_application = AddressApplication.query.filter_by(
@@ -834,6 +955,66 @@ def resident_proof_of_address():
         certificate=certificate
     )
 
+def _certificate_pdf_path(certificate):
+    return os.path.join(CERTIFICATE_CACHE_DIR, f"{certificate.certificate_number}.pdf")
+
+# Certificate table geometry: a 150pt label column and a 350pt value column
+_CERT_COLUMNS = (48, 198, 548)
+_CERT_ROW_HEIGHT = 24
+
+def _render_certificate_pdf(certificate, resident_info, target):
+    # Build the certificate PDF into target (a filename or file-like object).
+    # It is a single fixed-layout page, so it is drawn straight onto a canvas
+    # rather than run through Platypus' multi-pass layout
+    page_width, page_height = A4
+    centre = page_width / 2
+    pdf = canvas.Canvas(target, pagesize=A4)
+    
+    # Title
+    pdf.setFont('Helvetica-Bold', 18)
+    pdf.drawCentredString(centre, page_height - 90, "ADDRESS VERIFICATION CERTIFICATE")
+    
+    # Logo placeholder
+    pdf.setFont('Helvetica-Bold', 14)
+    pdf.drawCentredString(centre, page_height - 135, "AddressMe")
+    pdf.drawCentredString(centre, page_height - 165, "Official Proof of Address Certificate")
+    
+    # Certificate information
+    data = [
+        ["Certificate Number:", certificate.certificate_number],
+        ["Full Name:", f"{resident_info.firstName} {resident_info.lastName}"],
+        ["ID Number:", resident_info.idNumber],
+        ["Verified Address:", f"Unit {resident_info.unitNumber}, {resident_info.settlement}"],
+        ["", f"{resident_info.municipality}"],
+        ["", resident_info.postalCode],
+        ["Verification Date:", certificate.issue_date.strftime("%d %B %Y")],
+        ["Valid Until:", certificate.expiry_date.strftime("%d %B %Y")]
+    ]
+    
+    left, split, right = _CERT_COLUMNS
+    row_edges = [page_height - 210 - i * _CERT_ROW_HEIGHT for i in range(len(data) + 1)]
+    top, bottom = row_edges[0], row_edges[-1]
+    
+    # Shaded label column, then the grid over the whole table
+    pdf.setFillColor(colors.lightgrey)
+    pdf.rect(left, bottom, split - left, top - bottom, stroke=0, fill=1)
+    pdf.setFillColor(colors.black)
+    pdf.grid(list(_CERT_COLUMNS), row_edges)
+    
+    for row_top, (label, value) in zip(row_edges, data):
+        baseline = row_top - _CERT_ROW_HEIGHT + 9
+        pdf.setFont('Helvetica-Bold', 10)
+        pdf.drawString(left + 6, baseline, label)
+        pdf.setFont('Helvetica', 10)
+        pdf.drawString(split + 6, baseline, str(value))
+    
+    # Verification information
+    pdf.drawString(72, bottom - 40, "This certificate can be verified online at www.addressme.co.za/verify")
+    pdf.drawString(72, bottom - 54, f"using the certificate number: {certificate.certificate_number}")
+    
+    pdf.showPage()
+    pdf.save()
+
 @app.route('/resident/download-certificate/<int:certificate_id>')
 @login_required
 def download_certificate(certificate_id):
@@ -842,124 +1023,55 @@ def download_certificate(certificate_id):
         flash('Access denied. Only residents can download address certificates.', 'danger')
         return redirect(url_for('index'))
     
-    from models import ResidentInfo, AddressApplication, AddressCertificate
-    import io
-    from flask import send_file
-    from datetime import datetime
-    
     # Find the certificate and ensure it belongs to the current user
-    certificate = AddressCertificate.query.filter_by(id=certificate_id).first()
+    certificate = db.session.get(AddressCertificate, certificate_id)
     
     if not certificate:
         flash('Certificate not found.', 'danger')
         return redirect(url_for('resident_proof_of_address'))
     
     # Verify this belongs to the current user
-    application = AddressApplication.query.filter_by(id=certificate.application_id).first()
+    application = db.session.get(AddressApplication, certificate.application_id)
     if not application or application.applicant_id != current_user.id:
         flash('Access denied. You can only access your own certificates.', 'danger')
         return redirect(url_for('resident_proof_of_address'))
     
-    # Get resident info for the certificate
-    resident_info = ResidentInfo.query.filter_by(user_id=current_user.id).first()
-    
-    # Generate PDF content
+    # Certificates don't change once issued, so the PDF is rendered on the
+    # first download and the cached file is served from then on
+    pdf_path = _certificate_pdf_path(certificate)
     try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.lib import colors
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        
-        # Create a file-like buffer to receive PDF data
-        buffer = io.BytesIO()
-        
-        # Create the PDF document using ReportLab
-        doc = SimpleDocTemplate(buffer, pagesize=A4)
-        
-        # Define styles
-        styles = getSampleStyleSheet()
-        title_style = styles['Heading1']
-        title_style.alignment = 1  # Center alignment
-        subtitle_style = styles['Heading2']
-        subtitle_style.alignment = 1
-        normal_style = styles['Normal']
-        
-        # Create custom styles
-        header_style = ParagraphStyle(
-            'HeaderStyle',
-            parent=styles['Normal'],
-            fontName='Helvetica-Bold',
-            fontSize=14,
-            alignment=1,
-            spaceAfter=10
-        )
-        
-        # Create content elements
-        elements = []
-        
-        # Title
-        elements.append(Paragraph("ADDRESS VERIFICATION CERTIFICATE", title_style))
-        elements.append(Spacer(1, 20))
-        
-        # Logo placeholder
-        elements.append(Paragraph("AddressMe", header_style))
-        elements.append(Paragraph("Official Proof of Address Certificate", subtitle_style))
-        elements.append(Spacer(1, 20))
-        
-        # Certificate information
-        data = [
-            ["Certificate Number:", certificate.certificate_number],
-            ["Full Name:", f"{resident_info.firstName} {resident_info.lastName}"],
-            ["ID Number:", resident_info.idNumber],
-            ["Verified Address:", f"Unit {resident_info.unitNumber}, {resident_info.settlement}"],
-            ["", f"{resident_info.municipality}"],
-            ["", resident_info.postalCode],
-            ["Verification Date:", certificate.issue_date.strftime("%d %B %Y")],
-            ["Valid Until:", certificate.expiry_date.strftime("%d %B %Y")]
-        ]
-        
-        # Create table with the data
-        table = Table(data, colWidths=[150, 350])
-        
-        # Apply styles to the table
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('BACKGROUND', (1, 0), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
-        
-        elements.append(table)
-        elements.append(Spacer(1, 30))
-        
-        # Verification information
-        elements.append(Paragraph("This certificate can be verified online at www.addressme.co.za/verify", normal_style))
-        elements.append(Paragraph(f"using the certificate number: {certificate.certificate_number}", normal_style))
-        
-        # Build the PDF document
-        doc.build(elements)
-        
-        # Set the file pointer to the beginning of the buffer
-        buffer.seek(0)
+        if not os.path.exists(pdf_path):
+            # Get resident info for the certificate
+            resident_info = current_resident_info()
+            
+            # Render to a temporary name first so a concurrent download
+            # never serves a half-written file
+            tmp_path = f"{pdf_path}.{uuid.uuid4().hex}.tmp"
+            _render_certificate_pdf(certificate, resident_info, tmp_path)
+            os.replace(tmp_path, pdf_path)
         
         # Generate filename based on certificate number
         filename = f"AddressMe_Certificate_{certificate.certificate_number}.pdf"
         
-        # Send the PDF as a downloadable attachment
-        return send_file(
-            buffer,
+        # Send the PDF as a downloadable attachment. Serving the file by path
+        # lets the WSGI server use its file wrapper, and conditional requests
+        # get a 304 from the ETag/Last-Modified instead of the whole file
+        response = send_file(
+            pdf_path,
             as_attachment=True,
             download_name=filename,
-            mimetype='application/pdf'
+            mimetype='application/pdf',
+            conditional=True,
+            max_age=86400
         )
+        # It's the resident's own document: browsers may keep it, shared caches may not
+        response.cache_control.public = False
+        response.cache_control.private = True
+        return response
         
-    except Exception as e:
+    except Exception:
         # Log the error for debugging
-        print(f"Error generating PDF: {str(e)}")
+        app.logger.exception("Error generating PDF")
         flash('There was an error generating your certificate. Please try again later.', 'danger')
         return redirect(url_for('resident_proof_of_address'))
 
@@ -971,8 +1083,6 @@ def email_certificate(certificate_id):
         flash('Access denied. Only residents can email address certificates.', 'danger') 
         return redirect(url_for('index'))
     
-    from models import ResidentInfo, AddressApplication, AddressCertificate
-    
     # Extract form data
     recipient_email = request.form.get('recipient_email')
     email_message = request.form.get('email_message', '')
@@ -982,16 +1092,19 @@ def email_certificate(certificate_id):
     if not recipient_email:
         flash('Please provide a recipient email address.', 'danger')
         return redirect(url_for('resident_proof_of_address'))
+    if not _EMAIL_RE.match(recipient_email):
+        flash('Please provide a valid recipient email address.', 'danger')
+        return redirect(url_for('resident_proof_of_address'))
     
     # Find the certificate and ensure it belongs to the current user
-    certificate = AddressCertificate.query.filter_by(id=certificate_id).first()
+    certificate = db.session.get(AddressCertificate, certificate_id)
     
     if not certificate:
         flash('Certificate not found.', 'danger')
         return redirect(url_for('resident_proof_of_address'))
     
     # Verify this belongs to the current user
-    application = AddressApplication.query.filter_by(id=certificate.application_id).first()
+    application = db.session.get(AddressApplication, certificate.application_id)
     if not application or application.applicant_id != current_user.id:
         flash('Access denied. You can only access your own certificates.', 'danger')
         return redirect(url_for('resident_proof_of_address'))
@@ -999,22 +1112,58 @@ def email_certificate(certificate_id):
     # Since this is a demo, we'll simulate email sending
     try:
         # Log the email details for demonstration purposes
-        print(f"[DEMO EMAIL] Certificate #{certificate.certificate_number} would be sent to: {recipient_email}")
+        app.logger.debug("[DEMO EMAIL] Certificate #%s would be sent to: %s",
+                         certificate.certificate_number, recipient_email)
         if send_copy:
-            print(f"[DEMO EMAIL] Copy would be sent to: {current_user.email}")
+            app.logger.debug("[DEMO EMAIL] Copy would be sent to: %s", current_user.email)
         if email_message:
-            print(f"[DEMO EMAIL] Message: {email_message}")
+            app.logger.debug("[DEMO EMAIL] Message: %s", email_message)
             
         # Display success message
         flash(f'Demo Mode: Certificate would be emailed to {recipient_email}. In a real application, the email would be sent with the certificate attached.', 'success')
         return redirect(url_for('resident_proof_of_address'))
         
-    except Exception as e:
+    except Exception:
         # Log the error
-        print(f"Error sending email: {str(e)}")
+        app.logger.exception("Error sending email")
         flash('There was an error sending your certificate. Please try again later.', 'danger')
         return redirect(url_for('resident_proof_of_address'))
 
+# Uploaded photos are copied to disk in 1 MiB chunks, so a large upload is
+# never held in memory as a whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+def _save_upload(file_storage, filepath):
+    # Write under a temporary name and swap it in, so the photo URL never
+    # serves a partially written file. Returns False if the file couldn't be
+    # written; callers must not record the path then
+    tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(file_storage.stream, f, UPLOAD_CHUNK_SIZE)
+        os.replace(tmp_path, filepath)
+    except OSError:
+        app.logger.exception("Error saving upload to %s", filepath)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    return True
+
+def _claim_slot(slot_id):
+    # Mark an open slot booked with a single conditional UPDATE. Two residents
+    # racing for the same slot can't both match is_booked = false, so exactly
+    # one gets True back; the loser is told the slot is gone.
+    return AvailableTimeSlot.query.filter_by(id=slot_id, is_booked=False).update(
+        {AvailableTimeSlot.is_booked: True}
+    ) == 1
+
+def _cancel_pending_applications(user_id, reason):
+    # Cancel the user's pending applications with a single UPDATE
+    AddressApplication.query.filter_by(applicant_id=user_id, status='pending').update({
+        AddressApplication.status: 'cancelled',
+        AddressApplication.leader_notes: reason,
+    }, synchronize_session=False)
+
 @app.route('/resident/profile-settings', methods=['GET', 'POST'])
 @login_required
 def resident_profile_settings():
@@ -1022,47 +1171,35 @@ def resident_profile_settings():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import ResidentInfo
-    from werkzeug.security import generate_password_hash, check_password_hash
-    from werkzeug.utils import secure_filename
-    import os
-    
     # Get the resident's information
-    resident_info = ResidentInfo.query.filter_by(user_id=current_user.id).first()
+    resident_info = current_resident_info()
     
     if request.method == 'POST':
         form_type = request.form.get('form_type', '')
         
         # Handle personal information update
         if form_type == 'personal_info':
-            first_name = request.form.get('firstName')
-            last_name = request.form.get('lastName')
-            phone_number = request.form.get('phoneNumber')
-            email = request.form.get('email')
+            form, fields = _form_fields(_PERSONAL_INFO_FIELDS)
+            email = form.get('email')
             
-            if first_name and last_name and phone_number and email:
+            if all(fields.values()) and email:
                 # Update resident info
-                resident_info.firstName = first_name
-                resident_info.lastName = last_name
-                resident_info.phoneNumber = phone_number
+                _populate_obj(resident_info, fields)
                 
                 # Update user email
                 current_user.email = email
                 
                 # Update user full name
-                current_user.fullName = f"{first_name} {last_name}"
+                current_user.fullName = f"{fields['firstName']} {fields['lastName']}"
                 
                 # Reset verification status
                 current_user.isVerified = False
                 
                 # Reset any existing application statuses
-                from models import AddressApplication
-                existing_applications = AddressApplication.query.filter_by(applicant_id=current_user.id, status='pending').all()
-                for app in existing_applications:
-                    app.status = 'cancelled'
-                    app.leader_notes = "Application cancelled due to profile information change."
+                _cancel_pending_applications(current_user.id, "Application cancelled due to profile information change.")
                 
                 db.session.commit()
+                _pending_applications_changed()
                 flash('Personal information updated successfully! Your address verification has been reset and will need to be verified again.', 'warning')
             else:
                 flash('Please fill in all required fields.', 'danger')
@@ -1078,7 +1215,7 @@ def resident_profile_settings():
             elif not check_password_hash(current_user.password, current_password):
                 flash('Current password is incorrect.', 'danger')
             else:
-                current_user.password = generate_password_hash(new_password)
+                current_user.password = generate_password_hash(new_password, method=PASSWORD_HASH_METHOD)
                 db.session.commit()
                 flash('Password updated successfully!', 'success')
         
@@ -1088,13 +1225,12 @@ def resident_profile_settings():
             
             if id_photo and id_photo.filename:
                 filename = secure_filename(f"id_{current_user.id}_{id_photo.filename}")
-                filepath = os.path.join('static/uploads/id_photos', filename)
+                filepath = os.path.join(ID_PHOTO_DIR, filename)
                 
-                # Ensure the directory exists
-                os.makedirs('static/uploads/id_photos', exist_ok=True)
-                
-                # Save the file
-                id_photo.save(filepath)
+                # Save the file; leave the profile untouched if that fails
+                if not _save_upload(id_photo, filepath):
+                    flash('Your ID photo could not be saved. Please try again.', 'danger')
+                    return redirect(url_for('resident_profile_settings'))
                 
                 # Update the path in the database
                 resident_info.idPhotoPath = f"/{filepath}"
@@ -1103,13 +1239,10 @@ def resident_profile_settings():
                 current_user.isVerified = False
                 
                 # Reset any existing application statuses
-                from models import AddressApplication
-                existing_applications = AddressApplication.query.filter_by(applicant_id=current_user.id, status='pending').all()
-                for app in existing_applications:
-                    app.status = 'cancelled'
-                    app.leader_notes = "Application cancelled due to ID photo change."
+                _cancel_pending_applications(current_user.id, "Application cancelled due to ID photo change.")
                 
                 db.session.commit()
+                _pending_applications_changed()
                 
                 flash('ID photo updated successfully! Your address verification has been reset and will need to be verified again.', 'warning')
         
@@ -1118,13 +1251,12 @@ def resident_profile_settings():
             
             if face_photo and face_photo.filename:
                 filename = secure_filename(f"face_{current_user.id}_{face_photo.filename}")
-                filepath = os.path.join('static/uploads/face_photos', filename)
-                
-                # Ensure the directory exists
-                os.makedirs('static/uploads/face_photos', exist_ok=True)
+                filepath = os.path.join(FACE_PHOTO_DIR, filename)
                 
-                # Save the file
-                face_photo.save(filepath)
+                # Save the file; leave the profile untouched if that fails
+                if not _save_upload(face_photo, filepath):
+                    flash('Your profile photo could not be saved. Please try again.', 'danger')
+                    return redirect(url_for('resident_profile_settings'))
                 
                 # Update the path in the database
                 resident_info.facePhotoPath = f"/{filepath}"
@@ -1133,13 +1265,10 @@ def resident_profile_settings():
                 current_user.isVerified = False
                 
                 # Reset any existing application statuses
-                from models import AddressApplication
-                existing_applications = AddressApplication.query.filter_by(applicant_id=current_user.id, status='pending').all()
-                for app in existing_applications:
-                    app.status = 'cancelled'
-                    app.leader_notes = "Application cancelled due to profile photo change."
+                _cancel_pending_applications(current_user.id, "Application cancelled due to profile photo change.")
                 
                 db.session.commit()
+                _pending_applications_changed()
                 
                 flash('Profile photo updated successfully! Your address verification has been reset and will need to be verified again.', 'warning')
         
@@ -1168,37 +1297,9 @@ def resident_my_address():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import ResidentInfo, AddressApplication, AddressCertificate
-    
-    # Get the resident's information
-    resident_info = ResidentInfo.query.filter_by(user_id=current_user.id).first()
-    
-    # Get the most recent approved application, if any
-    approved_application = AddressApplication.query.filter_by(
-        applicant_id=current_user.id,
-        status='approved'
-    ).order_by(AddressApplication.updated_at.desc()).first()
-    
-    # Get the certificate for the approved application, if any
-    certificate = None
-    if approved_application:
-        certificate = AddressCertificate.query.filter_by(
-            application_id=approved_application.id
-        ).first()
-    
-    # Check if there's a pending application
-    pending_application = AddressApplication.query.filter(
-        AddressApplication.applicant_id == current_user.id,
-        AddressApplication.status.in_(['pending', 'leader_approved', 'interview_scheduled', 'interview_completed'])
-    ).order_by(AddressApplication.created_at.desc()).first()
-    
-    return render_template(
-        'resident/my_address.html',
-        resident_info=resident_info,
-        approved_application=approved_application,
-        certificate=certificate,
-        pending_application=pending_application
-    )
+    # Same data as the dashboard: the latest approved application with its
+    # certificate, and any pending application
+    return render_template('resident/my_address.html', **_load_resident_context(current_user))
 
 @app.route('/resident/address-history')
 @login_required
@@ -1207,8 +1308,6 @@ def resident_address_history():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import ResidentInfo, AddressApplication, AddressCertificate
-    
     # Get all approved and superseded applications for the user, ordered by date (newest first)
     approved_applications = AddressApplication.query.filter(
         AddressApplication.applicant_id == current_user.id,
@@ -1222,14 +1321,14 @@ def resident_address_history():
             current_active = app
             break
     
-    # Get certificates for all applications
+    # Get certificates for all applications in one IN query, keeping the
+    # first certificate issued for each application
     certificates = {}
-    for app in approved_applications:
-        certificate = AddressCertificate.query.filter_by(
-            application_id=app.id
-        ).first()
-        if certificate:
-            certificates[app.id] = certificate
+    if approved_applications:
+        for certificate in AddressCertificate.query.filter(
+            AddressCertificate.application_id.in_([a.id for a in approved_applications])
+        ).order_by(AddressCertificate.id):
+            certificates.setdefault(certificate.application_id, certificate)
     
     return render_template(
         'resident/address_history.html',
@@ -1245,22 +1344,32 @@ def resident_update_address():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import ResidentInfo, AddressApplication
-    
     # Get the resident's information
-    resident_info = ResidentInfo.query.filter_by(user_id=current_user.id).first()
+    resident_info = current_resident_info()
     
     if not resident_info:
         flash('No address information found. Please complete your profile first.', 'warning')
         return redirect(url_for('resident_my_address'))
     
+    if request.method == 'POST':
+        # Reset verification status before checking for a pending application.
+        # The UPDATE takes this user's row lock (the write lock on SQLite), so
+        # a double submit waits here until the first request commits and then
+        # sees the pending application it created. A FOR UPDATE on the
+        # applications query couldn't do this: there is no row to lock until
+        # the new application exists, and SQLite ignores FOR UPDATE.
+        db.session.execute(
+            update(User).where(User.id == current_user.id).values(isVerified=False)
+        )
+    
     # Check if there's a pending application
     pending_application = AddressApplication.query.filter(
         AddressApplication.applicant_id == current_user.id,
-        AddressApplication.status.in_(['pending', 'leader_approved', 'interview_scheduled', 'interview_completed'])
+        _IS_PENDING
     ).order_by(AddressApplication.created_at.desc()).first()
     
     if pending_application:
+        db.session.rollback()
         flash('You already have a pending application. Please wait for it to be processed before updating your address.', 'warning')
         return redirect(url_for('resident_my_address'))
     
@@ -1281,21 +1390,23 @@ def resident_update_address():
             resident_info.postalCode = postalCode
             resident_info.isOwner = isOwner
             resident_info.municipality = municipality
-            resident_info.wardNumber = int(wardNumber)
+            resident_info.wardNumber = _safe_int(wardNumber)
             resident_info.councillorName = councillorName
             
-            # Mark any approved applications as superseded in officer_notes
-            approved_applications = AddressApplication.query.filter_by(
+            # Mark any approved applications as superseded in officer_notes,
+            # appending to existing notes, in one UPDATE
+            superseded_note = "This application has been superseded by an address update."
+            AddressApplication.query.filter_by(
                 applicant_id=current_user.id,
                 status='approved'
-            ).all()
-            
-            for app in approved_applications:
-                app.status = 'superseded'
-                if app.officer_notes:
-                    app.officer_notes += "\n\nThis application has been superseded by an address update."
-                else:
-                    app.officer_notes = "This application has been superseded by an address update."
+            ).update({
+                AddressApplication.status: 'superseded',
+                AddressApplication.officer_notes: case(
+                    (or_(AddressApplication.officer_notes.is_(None),
+                         AddressApplication.officer_notes == ''), superseded_note),
+                    else_=AddressApplication.officer_notes + "\n\n" + superseded_note
+                ),
+            }, synchronize_session=False)
             
             # Create a new pending application
             new_application = AddressApplication(
@@ -1304,18 +1415,16 @@ def resident_update_address():
             )
             db.session.add(new_application)
             
-            # Reset verification status
-            current_user.isVerified = False
-            
-            # Commit all changes
+            # Commit all changes, including the verification reset above
             db.session.commit()
+            _pending_applications_changed()
             
             flash('Your address has been updated. You will need to go through the verification process again.', 'info')
             return redirect(url_for('resident_my_address'))
             
         except Exception as e:
             db.session.rollback()
-            print(f"Error in resident_update_address: {str(e)}")
+            app.logger.exception("Error in resident_update_address")
             flash(f'Error updating address: {str(e)}', 'danger')
             return redirect(url_for('resident_update_address'))
     
@@ -1332,34 +1441,38 @@ def leader_dashboard():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import LeaderInfo, AddressApplication, User
-    
     # Get the leader's information
-    leader_info = LeaderInfo.query.filter_by(user_id=current_user.id).first()
+    leader_info = current_leader_info()
     
     # Leaders must be approved to access the dashboard
     if not leader_info or not leader_info.isApproved:
         flash('Your leader account is pending approval.', 'warning')
         return redirect(url_for('index'))
     
-    # Get applications for leader's ward
-    applications = []
+    # Count applications by status in one GROUP BY: all pending applications,
+    # plus the ones this leader has approved or rejected
     # In a real app, we'd filter by ward/municipality
-    # Here, we'll just get all pending applications for the demo
-    applications = AddressApplication.query.filter_by(status='pending').all()
-    
-    # Count applications by status
-    pending_applications_count = AddressApplication.query.filter_by(status='pending').count()
-    approved_applications_count = AddressApplication.query.filter_by(
-        status='leader_approved', leader_id=current_user.id).count()
-    rejected_applications_count = AddressApplication.query.filter_by(
-        status='rejected', leader_id=current_user.id).count()
+    status_counts = dict(db.session.query(
+        AddressApplication.status,
+        func.count(AddressApplication.id)
+    ).filter(
+        or_(AddressApplication.status == 'pending',
+            AddressApplication.leader_id == current_user.id)
+    ).group_by(AddressApplication.status).all())
+    
+    pending_applications_count = g.pending_applications_count = status_counts.get('pending', 0)
+    approved_applications_count = status_counts.get('leader_approved', 0)
+    rejected_applications_count = status_counts.get('rejected', 0)
     total_applications_count = (pending_applications_count + 
                                 approved_applications_count + 
                                 rejected_applications_count)
     
     # Get the most recent applications for the dashboard
-    recent_applications = applications[:5] if applications else []
+    # Here, we'll just show pending applications for the demo; the applicant
+    # (and their resident info) comes back in the same query
+    recent_applications = AddressApplication.query.options(
+        joinedload(AddressApplication.applicant)
+    ).filter_by(status='pending').limit(5).all()
     
     return render_template(
         'leader/dashboard.html',
@@ -1371,6 +1484,16 @@ def leader_dashboard():
         recent_applications=recent_applications
     )
 
+# The leader application lists only render each application's status and
+# dates plus the applicant's name and settlement
+_LEADER_APPLICATION_LIST_LOAD = (
+    load_only(AddressApplication.status, AddressApplication.created_at, AddressApplication.updated_at),
+    joinedload(AddressApplication.applicant).options(
+        load_only(User.fullName),
+        joinedload(User.resident_info).load_only(ResidentInfo.settlement),
+    ),
+)
+
 @app.route('/leader/applications')
 @login_required
 def leader_applications():
@@ -1378,11 +1501,8 @@ def leader_applications():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import LeaderInfo, AddressApplication, ResidentInfo, User
-    from sqlalchemy import or_
-    
     # Get the leader's information
-    leader_info = LeaderInfo.query.filter_by(user_id=current_user.id).first()
+    leader_info = current_leader_info()
     
     # Leaders must be approved to access the dashboard
     if not leader_info or not leader_info.isApproved:
@@ -1395,28 +1515,31 @@ def leader_applications():
     per_page = 10  # Number of applications per page
     
     # Show all applications (pending, approved, rejected, etc.)
-    if status == 'all':
-        applications = AddressApplication.query.all()
-    elif status == 'pending':
-        applications = AddressApplication.query.filter_by(status='pending').all()
+    # The list shows each applicant's name and settlement, so join them in
+    applications_query = AddressApplication.query.options(*_list_options(*_LEADER_APPLICATION_LIST_LOAD))
+    if status == 'pending':
+        applications_query = applications_query.filter_by(status='pending')
     elif status == 'approved':
-        applications = AddressApplication.query.filter(
+        applications_query = applications_query.filter(
             AddressApplication.status.in_(['leader_approved', 'interview_scheduled', 'interview_completed', 'approved'])
-        ).all()
+        )
     elif status == 'rejected':
-        applications = AddressApplication.query.filter_by(status='rejected').all()
-    else:
-        applications = AddressApplication.query.all()
-    
-    # Count pending applications for notification badge
-    pending_applications_count = AddressApplication.query.filter_by(status='pending').count()
+        applications_query = applications_query.filter_by(status='rejected')
+    
+    # Only fetch the requested page, newest first; the id breaks ties so
+    # applications sharing a timestamp don't shift between pages
+    pagination = applications_query.order_by(
+        AddressApplication.created_at.desc(), AddressApplication.id.desc()
+    ).paginate(
+        page=page, per_page=per_page, error_out=False
+    )
     
     return render_template(
         'leader/applications.html',
         leader_info=leader_info,
-        applications=applications,
-        current_status=status,
-        pending_applications_count=pending_applications_count
+        applications=pagination.items,
+        pagination=pagination,
+        current_status=status
     )
 
 @app.route('/leader/application-history')
@@ -1426,10 +1549,8 @@ def leader_application_history():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import LeaderInfo, AddressApplication, ResidentInfo, User
-    
     # Get the leader's information
-    leader_info = LeaderInfo.query.filter_by(user_id=current_user.id).first()
+    leader_info = current_leader_info()
     
     # Leaders must be approved to access the dashboard
     if not leader_info or not leader_info.isApproved:
@@ -1439,15 +1560,19 @@ def leader_application_history():
     # Get query parameters
     status = request.args.get('status', 'all')
     
-    # Get applications from residents in the leader's municipality/ward
-    applications_query = db.session.query(AddressApplication, User, ResidentInfo)\
-        .join(User, User.id == AddressApplication.applicant_id)\
-        .join(ResidentInfo, ResidentInfo.user_id == User.id)\
-        .filter(
-            # Applications in leader's municipality and ward
-            ResidentInfo.municipality == leader_info.municipality,
-            ResidentInfo.wardNumber == leader_info.wardNumber
-        )
+    # Residents in the leader's municipality/ward. Filtering applications by
+    # applicant_id IN (...) rather than joining ResidentInfo means a resident
+    # can never duplicate an application row.
+    ward_residents = db.session.query(ResidentInfo.user_id).filter(
+        ResidentInfo.municipality == leader_info.municipality,
+        ResidentInfo.wardNumber == leader_info.wardNumber
+    )
+    
+    # Get applications from residents in the leader's municipality/ward,
+    # with the applicant (and their resident info) the template renders
+    applications_query = AddressApplication.query\
+        .options(*_list_options(*_LEADER_APPLICATION_LIST_LOAD))\
+        .filter(AddressApplication.applicant_id.in_(ward_residents))
     
     # Only show approved and rejected applications in application history
     # By default, show both approved and rejected
@@ -1462,31 +1587,24 @@ def leader_application_history():
         applications_query = applications_query.filter(AddressApplication.status == 'rejected')
     
     # Execute query
-    applications_result = applications_query.all()
-    
-    # Extract just the application objects and ensure no duplicates
-    unique_app_ids = set()
-    applications = []
-    for result in applications_result:
-        app = result[0]
-        if app.id not in unique_app_ids:
-            unique_app_ids.add(app.id)
-            applications.append(app)
-    
-    # Count pending applications for notification badge
-    pending_applications_count = db.session.query(AddressApplication, User, ResidentInfo)\
-        .join(User, User.id == AddressApplication.applicant_id)\
-        .join(ResidentInfo, ResidentInfo.user_id == User.id)\
-        .filter(
-            ResidentInfo.municipality == leader_info.municipality,
-            ResidentInfo.wardNumber == leader_info.wardNumber,
-            AddressApplication.status == 'pending'
-        ).count()
-    
-    # Gather statistics
+    applications = applications_query.all()
+    
+    # Count the ward's applications by status in one GROUP BY; this also
+    # gives the pending count for the notification badge
+    status_counts = dict(db.session.query(
+        AddressApplication.status,
+        func.count(AddressApplication.id)
+    ).filter(
+        AddressApplication.applicant_id.in_(ward_residents)
+    ).group_by(AddressApplication.status).all())
+    pending_applications_count = g.pending_applications_count = status_counts.get('pending', 0)
+    
+    # Gather statistics (approved/rejected follow the status filter, like the list)
     stats = {
-        'approved': len([app for app in applications if app.status in ['leader_approved', 'interview_scheduled', 'interview_completed', 'approved']]),
-        'rejected': len([app for app in applications if app.status == 'rejected']),
+        'approved': 0 if status == 'rejected' else sum(
+            status_counts.get(s, 0) for s in ('leader_approved', 'interview_scheduled', 'interview_completed', 'approved')
+        ),
+        'rejected': 0 if status == 'approved' else status_counts.get('rejected', 0),
         'pending': pending_applications_count,
         'total': len(applications)
     }
@@ -1507,38 +1625,26 @@ def leader_profile_settings():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import LeaderInfo, AddressApplication, User, ResidentInfo
-    from werkzeug.security import generate_password_hash, check_password_hash
-    from werkzeug.utils import secure_filename
-    import os
-    
     # Get the leader's information
-    leader_info = LeaderInfo.query.filter_by(user_id=current_user.id).first()
-    
-    # Count pending applications for notification badge
-    pending_applications_count = AddressApplication.query.filter_by(status='pending').count()
+    leader_info = current_leader_info()
     
     if request.method == 'POST':
         form_type = request.form.get('form_type', '')
         
         # Handle personal information update
         if form_type == 'personal_info':
-            first_name = request.form.get('firstName')
-            last_name = request.form.get('lastName')
-            phone_number = request.form.get('phoneNumber')
-            email = request.form.get('email')
+            form, fields = _form_fields(_PERSONAL_INFO_FIELDS)
+            email = form.get('email')
             
-            if first_name and last_name and phone_number and email:
+            if all(fields.values()) and email:
                 # Update leader info
-                leader_info.firstName = first_name
-                leader_info.lastName = last_name
-                leader_info.phoneNumber = phone_number
+                _populate_obj(leader_info, fields)
                 
                 # Update user email
                 current_user.email = email
                 
                 # Update user full name
-                current_user.fullName = f"{first_name} {last_name}"
+                current_user.fullName = f"{fields['firstName']} {fields['lastName']}"
                 
                 # Reset approval status since information has changed
                 leader_info.isApproved = False
@@ -1550,21 +1656,13 @@ def leader_profile_settings():
         
         # Handle office information update
         elif form_type == 'office_info':
-            municipality = request.form.get('municipality')
-            ward_number = request.form.get('wardNumber')
-            office_location = request.form.get('officeLocation')
-            settlement = request.form.get('settlement')
-            unit_number = request.form.get('unitNumber')
-            postal_code = request.form.get('postalCode')
-            
-            if municipality and ward_number and office_location and settlement and unit_number and postal_code:
+            form, fields = _form_fields(_LEADER_OFFICE_FIELDS)
+            ward_number = form.get('wardNumber')
+            
+            if all(fields.values()) and ward_number:
                 # Update leader info
-                leader_info.municipality = municipality
-                leader_info.wardNumber = int(ward_number)
-                leader_info.officeLocation = office_location
-                leader_info.settlement = settlement
-                leader_info.unitNumber = unit_number
-                leader_info.postalCode = postal_code
+                _populate_obj(leader_info, fields)
+                leader_info.wardNumber = _safe_int(ward_number)
                 
                 # Reset approval status since information has changed
                 leader_info.isApproved = False
@@ -1585,7 +1683,7 @@ def leader_profile_settings():
             elif not check_password_hash(current_user.password, current_password):
                 flash('Current password is incorrect.', 'danger')
             else:
-                current_user.password = generate_password_hash(new_password)
+                current_user.password = generate_password_hash(new_password, method=PASSWORD_HASH_METHOD)
                 db.session.commit()
                 flash('Password updated successfully!', 'success')
         
@@ -1595,13 +1693,12 @@ def leader_profile_settings():
             
             if id_photo and id_photo.filename:
                 filename = secure_filename(f"id_{current_user.id}_{id_photo.filename}")
-                filepath = os.path.join('static/uploads/id_photos', filename)
-                
-                # Ensure the directory exists
-                os.makedirs('static/uploads/id_photos', exist_ok=True)
+                filepath = os.path.join(ID_PHOTO_DIR, filename)
                 
-                # Save the file
-                id_photo.save(filepath)
+                # Save the file; leave the profile untouched if that fails
+                if not _save_upload(id_photo, filepath):
+                    flash('Your ID photo could not be saved. Please try again.', 'danger')
+                    return redirect(url_for('leader_profile_settings'))
                 
                 # Update the path in the database
                 leader_info.idPhotoPath = f"/{filepath}"
@@ -1614,13 +1711,12 @@ def leader_profile_settings():
             
             if face_photo and face_photo.filename:
                 filename = secure_filename(f"face_{current_user.id}_{face_photo.filename}")
-                filepath = os.path.join('static/uploads/face_photos', filename)
+                filepath = os.path.join(FACE_PHOTO_DIR, filename)
                 
-                # Ensure the directory exists
-                os.makedirs('static/uploads/face_photos', exist_ok=True)
-                
-                # Save the file
-                face_photo.save(filepath)
+                # Save the file; leave the profile untouched if that fails
+                if not _save_upload(face_photo, filepath):
+                    flash('Your profile photo could not be saved. Please try again.', 'danger')
+                    return redirect(url_for('leader_profile_settings'))
                 
                 # Update the path in the database
                 leader_info.facePhotoPath = f"/{filepath}"
@@ -1632,8 +1728,7 @@ def leader_profile_settings():
     
     return render_template(
         'leader/profile_settings.html',
-        leader_info=leader_info,
-        pending_applications_count=pending_applications_count
+        leader_info=leader_info
     )
 
 @app.route('/police/dashboard')
@@ -1643,11 +1738,8 @@ def police_dashboard():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, Appointment, AddressApplication
-    from datetime import datetime, timedelta
-    
     # Get the officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access the dashboard
     if not police_info or not police_info.isApproved:
@@ -1659,36 +1751,42 @@ def police_dashboard():
     today_start = datetime.combine(today, datetime.min.time())
     today_end = datetime.combine(today, datetime.max.time())
     
-    # Get today's appointments
-    today_appointments = Appointment.query.filter(
-        Appointment.officer_id == current_user.id,
-        Appointment.appointment_date >= today_start,
-        Appointment.appointment_date <= today_end
-    ).order_by(Appointment.appointment_date).all()
+    # Count today's, upcoming and completed appointments in one pass, then
+    # fetch all of today's plus the next 10 upcoming together and split
+    # them by date
+    today_count, upcoming_appointments_count, completed_interviews_count = db.session.query(
+        func.count(case((Appointment.appointment_date.between(today_start, today_end), 1))),
+        func.count(case((Appointment.appointment_date > today_end, 1))),
+        func.count(case((Appointment.status == 'completed', 1)))
+    ).filter(
+        Appointment.officer_id == current_user.id
+    ).one()
     
-    # Get upcoming appointments
-    upcoming_appointments = Appointment.query.filter(
+    appointments = Appointment.query.options(
+        *_list_options(joinedload(Appointment.resident).joinedload(User.resident_info))
+    ).filter(
         Appointment.officer_id == current_user.id,
-        Appointment.appointment_date > today_end
-    ).order_by(Appointment.appointment_date).all()
-    
-    # Get applications for review
-    applications_for_review = AddressApplication.query.filter_by(
+        Appointment.appointment_date >= today_start
+    ).order_by(Appointment.appointment_date).limit(today_count + 10).all()
+    today_appointments = appointments[:today_count]
+    upcoming_appointments = appointments[today_count:]
+    
+    # Application statistics for the dashboard, counted by status in one query
+    status_counts = dict(db.session.query(
+        AddressApplication.status, func.count(AddressApplication.id)
+    ).filter(
+        AddressApplication.officer_id == current_user.id,
+        AddressApplication.status.in_(['approved', 'interview_completed'])
+    ).group_by(AddressApplication.status).all())
+    approved_applications_count = status_counts.get('approved', 0)
+    pending_review_count = status_counts.get('interview_completed', 0)
+    
+    # Applications awaiting review, for display
+    recent_applications = AddressApplication.query.options(
+        *_list_options(joinedload(AddressApplication.applicant))
+    ).filter_by(
         status='interview_completed', officer_id=current_user.id
-    ).all()
-    
-    # Statistics for the dashboard
-    upcoming_appointments_count = len(upcoming_appointments)
-    completed_interviews_count = Appointment.query.filter_by(
-        officer_id=current_user.id, status='completed'
-    ).count()
-    approved_applications_count = AddressApplication.query.filter_by(
-        status='approved', officer_id=current_user.id
-    ).count()
-    pending_review_count = len(applications_for_review)
-    
-    # Recent applications for display
-    recent_applications = applications_for_review[:5] if applications_for_review else []
+    ).limit(5).all()
     
     return render_template(
         'police/dashboard.html',
@@ -1709,20 +1807,19 @@ def police_appointments():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, Appointment
-    from datetime import datetime
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access the dashboard
     if not police_info or not police_info.isApproved:
         flash('Your police officer account is pending approval.', 'warning')
         return redirect(url_for('index'))
     
-    # Get all upcoming appointments
+    # Get all upcoming appointments, with each resident joined in for the list
     today = datetime.now()
-    upcoming_appointments = Appointment.query.filter(
+    upcoming_appointments = Appointment.query.options(
+        joinedload(Appointment.resident)
+    ).filter(
         Appointment.officer_id == current_user.id,
         Appointment.appointment_date >= today,
         Appointment.status == 'scheduled'
@@ -1741,20 +1838,19 @@ def police_past_appointments():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, Appointment
-    from datetime import datetime
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access the dashboard
     if not police_info or not police_info.isApproved:
         flash('Your police officer account is pending approval.', 'warning')
         return redirect(url_for('index'))
     
-    # Get all past appointments
+    # Get all past appointments, with each resident joined in for the list
     today = datetime.now()
-    past_appointments = Appointment.query.filter(
+    past_appointments = Appointment.query.options(
+        joinedload(Appointment.resident)
+    ).filter(
         Appointment.officer_id == current_user.id
     ).filter(
         (Appointment.appointment_date < today) | 
@@ -1767,6 +1863,14 @@ def police_past_appointments():
         past_appointments=past_appointments
     )
 
+# Verified addresses show the certificate details, the resident's name and
+# their settlement/unit; nothing is read from the application itself
+_VERIFIED_ADDRESS_COLUMNS = (
+    AddressCertificate.certificate_number, AddressCertificate.issue_date,
+    AddressCertificate.expiry_date, AddressCertificate.pdf_path,
+    User.fullName, ResidentInfo.settlement, ResidentInfo.unitNumber,
+)
+
 @app.route('/police/verified-addresses')
 @login_required
 def police_verified_addresses():
@@ -1774,29 +1878,29 @@ def police_verified_addresses():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, AddressApplication, AddressCertificate, User, ResidentInfo
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access the dashboard
     if not police_info or not police_info.isApproved:
         flash('Your police officer account is pending approval.', 'warning')
         return redirect(url_for('index'))
     
-    # Get all approved applications with certificates
-    verified_addresses = db.session.query(
-        AddressApplication, User, ResidentInfo, AddressCertificate
-    ).join(
-        User, User.id == AddressApplication.applicant_id
-    ).join(
-        ResidentInfo, ResidentInfo.user_id == User.id
-    ).join(
-        AddressCertificate, AddressCertificate.application_id == AddressApplication.id
-    ).filter(
-        AddressApplication.officer_id == current_user.id,
-        AddressApplication.status == 'approved'
-    ).order_by(AddressCertificate.issue_date.desc()).all()
+    # Get all approved applications with certificates. The page is read-only,
+    # so this selects plain rows of the rendered columns rather than ORM
+    # objects; the template reads each column by name.
+    verified_addresses = db.session.execute(
+        select(*_VERIFIED_ADDRESS_COLUMNS).select_from(AddressApplication).join(
+            User, User.id == AddressApplication.applicant_id
+        ).join(
+            ResidentInfo, ResidentInfo.user_id == User.id
+        ).join(
+            AddressCertificate, AddressCertificate.application_id == AddressApplication.id
+        ).where(
+            AddressApplication.officer_id == current_user.id,
+            AddressApplication.status == 'approved'
+        ).order_by(AddressCertificate.issue_date.desc())
+    ).all()
     
     return render_template(
         'police/verified_addresses.html',
@@ -1811,27 +1915,21 @@ def police_profile_settings():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, User
-    from werkzeug.security import generate_password_hash, check_password_hash
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Handle form submission
     if request.method == 'POST':
         if 'update_profile' in request.form:
             # Update profile information
-            police_info.firstName = request.form.get('firstName')
-            police_info.lastName = request.form.get('lastName')
-            police_info.phoneNumber = request.form.get('phoneNumber')
-            police_info.rank = request.form.get('rank')
-            police_info.stationName = request.form.get('stationName')
+            form, fields = _form_fields(_POLICE_PROFILE_FIELDS)
+            _populate_obj(police_info, fields)
             
             # Update user email if changed
-            new_email = request.form.get('email')
+            new_email = form.get('email')
             if new_email != current_user.email:
-                existing_user = User.query.filter_by(email=new_email).first()
-                if existing_user and existing_user.id != current_user.id:
+                existing_user_id = db.session.scalar(select(User.id).filter_by(email=new_email).limit(1))
+                if existing_user_id and existing_user_id != current_user.id:
                     flash('Email already in use.', 'danger')
                 else:
                     current_user.email = new_email
@@ -1853,7 +1951,7 @@ def police_profile_settings():
             elif new_password != confirm_password:
                 flash('New passwords do not match.', 'danger')
             else:
-                current_user.password = generate_password_hash(new_password)
+                current_user.password = generate_password_hash(new_password, method=PASSWORD_HASH_METHOD)
                 db.session.commit()
                 flash('Password changed successfully.', 'success')
         
@@ -1871,44 +1969,47 @@ def police_delete_weekly_schedule(schedule_id):
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, WeeklySchedule, AvailableTimeSlot, ScheduledBreak
-    from datetime import datetime
-    import logging
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access this feature
     if not police_info or not police_info.isApproved:
         flash('Your police officer account is pending approval.', 'warning')
         return redirect(url_for('index'))
     
-    # Get the specific weekly schedule
-    schedule = WeeklySchedule.query.filter_by(
-        id=schedule_id,
-        officer_id=current_user.id
-    ).first()
+    # Check the schedule belongs to this officer; only its day is needed for
+    # the message, so no ORM object is loaded
+    day_of_week = db.session.scalar(
+        select(WeeklySchedule.day_of_week).where(
+            WeeklySchedule.id == schedule_id,
+            WeeklySchedule.officer_id == current_user.id
+        )
+    )
     
-    if not schedule:
+    if day_of_week is None:
         flash('Schedule not found.', 'danger')
         return redirect(url_for('police_availability'))
     
     try:
         # Mark the schedule as inactive (soft delete)
-        schedule.is_active = False
+        db.session.execute(
+            update(WeeklySchedule).where(WeeklySchedule.id == schedule_id).values(is_active=False)
+        )
         
         # Delete all future non-booked time slots associated with this schedule
         now = datetime.now()
-        deleted_slots = AvailableTimeSlot.query.filter(
-            AvailableTimeSlot.weekly_schedule_id == schedule.id,
-            AvailableTimeSlot.is_booked == False,
-            AvailableTimeSlot.start_time > now
-        ).delete()
+        deleted_slots = db.session.execute(
+            delete(AvailableTimeSlot).where(
+                AvailableTimeSlot.weekly_schedule_id == schedule_id,
+                AvailableTimeSlot.is_booked == False,
+                AvailableTimeSlot.start_time > now
+            ),
+            execution_options={'synchronize_session': False}
+        ).rowcount
         
         db.session.commit()
         
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        flash(f'Removed weekly schedule for {days[schedule.day_of_week]} and {deleted_slots} future slots.', 'success')
+        flash(f'Removed weekly schedule for {DAYS_OF_WEEK[day_of_week]} and {deleted_slots} future slots.', 'success')
     except Exception as e:
         logging.error(f"Error deleting weekly schedule: {e}")
         db.session.rollback()
@@ -1924,52 +2025,39 @@ def police_availability():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, AvailableTimeSlot, WeeklySchedule
-    from datetime import datetime
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access this page
     if not police_info or not police_info.isApproved:
         flash('Your police officer account is pending approval.', 'warning')
         return redirect(url_for('index'))
     
-    # Get all available time slots for this officer
-    available_slots = AvailableTimeSlot.query.filter_by(
+    # Get all of this officer's time slots, booked and available; the slot
+    # list and the calendar both render this same list
+    available_slots = AvailableTimeSlot.query.options(*_list_options()).filter_by(
         officer_id=current_user.id
     ).order_by(AvailableTimeSlot.start_time).all()
     
-    # Get all slots (both available and booked) for calendar
-    all_slots = AvailableTimeSlot.query.filter_by(
-        officer_id=current_user.id
-    ).all()
-    
-    # Get weekly schedules including their scheduled breaks
-    from models import ScheduledBreak
-    
-    weekly_schedules = WeeklySchedule.query.filter_by(
+    # Get weekly schedules including their scheduled breaks; the breaks for
+    # every schedule come back in one follow-up SELECT ... WHERE schedule_id IN (...)
+    weekly_schedules = WeeklySchedule.query.options(*_list_options(
+        selectinload(WeeklySchedule.breaks)
+    )).filter_by(
         officer_id=current_user.id,
         is_active=True
     ).order_by(WeeklySchedule.day_of_week, WeeklySchedule.start_time).all()
     
-    # Eager load breaks for each schedule
-    for schedule in weekly_schedules:
-        schedule.breaks = ScheduledBreak.query.filter_by(schedule_id=schedule.id).all()
-    
     # Get today's date in ISO format for min date inputs
     today_date = datetime.now().strftime('%Y-%m-%d')
     
-    # Days of the week for display
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    
     return render_template(
         'police/availability.html',
         police_info=police_info,
         available_slots=available_slots,
-        all_slots=all_slots,
+        all_slots=available_slots,
         weekly_schedules=weekly_schedules,
-        days=days,
+        days=DAYS_OF_WEEK,
         today_date=today_date
     )
 
@@ -1980,11 +2068,8 @@ def police_add_availability():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, AvailableTimeSlot
-    from datetime import datetime
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access this feature
     if not police_info or not police_info.isApproved:
@@ -2017,14 +2102,14 @@ def police_add_availability():
             flash('Cannot add time slots in the past.', 'danger')
             return redirect(url_for('police_availability'))
         
-        # Check for overlapping slots
-        overlapping_slots = AvailableTimeSlot.query.filter(
+        # Check for overlapping slots; EXISTS stops at the first match
+        has_overlap = db.session.query(AvailableTimeSlot.query.filter(
             AvailableTimeSlot.officer_id == current_user.id,
             AvailableTimeSlot.start_time < end_datetime,
             AvailableTimeSlot.end_time > start_datetime
-        ).all()
+        ).exists()).scalar()
         
-        if overlapping_slots:
+        if has_overlap:
             flash('This time slot overlaps with an existing slot.', 'danger')
             return redirect(url_for('police_availability'))
         
@@ -2057,10 +2142,8 @@ def police_delete_availability(slot_id):
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, AvailableTimeSlot
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access this feature
     if not police_info or not police_info.isApproved:
@@ -2068,7 +2151,7 @@ def police_delete_availability(slot_id):
         return redirect(url_for('index'))
     
     # Find the time slot
-    time_slot = AvailableTimeSlot.query.get(slot_id)
+    time_slot = db.session.get(AvailableTimeSlot, slot_id)
     
     if not time_slot or time_slot.officer_id != current_user.id:
         flash('Time slot not found.', 'danger')
@@ -2088,6 +2171,100 @@ def police_delete_availability(slot_id):
     
     return redirect(url_for('police_availability'))
 
+# Inserts one slot unless it overlaps one of the officer's existing slots,
+# in a single statement; executed with a list of slot dicts, the database
+# runs the overlap check per row and rowcount is the number inserted
+_SLOT_COLUMNS = ('officer_id', 'weekly_schedule_id', 'start_time', 'end_time', 'is_booked',
+                 'municipality', 'station_name', 'postal_code')
+_existing_slot = AvailableTimeSlot.__table__.alias('existing_slot')
+_INSERT_SLOT_IF_FREE = insert(AvailableTimeSlot.__table__).from_select(
+    _SLOT_COLUMNS,
+    select(*(bindparam(name, type_=AvailableTimeSlot.__table__.c[name].type)
+             for name in _SLOT_COLUMNS)).where(~select(_existing_slot.c.id).where(
+        _existing_slot.c.officer_id == bindparam('officer_id'),
+        _existing_slot.c.start_time < bindparam('end_time'),
+        _existing_slot.c.end_time > bindparam('start_time')
+    ).exists())
+)
+
+def _candidate_slots(first_day_start, day_length, break_times, weeks, now):
+    # Yield (start, end) for each 30-minute interview slot of a working window
+    # that starts at first_day_start and repeats weekly for `weeks` weeks,
+    # skipping past days and slots that overlap a break. Pure Python, so the
+    # caller can build every slot before touching the database.
+    
+    # Sort the breaks by start once; break_ends_so_far[i] is the latest end
+    # among the first i + 1 breaks, so a slot overlaps a break iff some break
+    # starting before the slot ends has break_ends_so_far past its start
+    break_times = sorted(break_times)
+    break_starts = [break_start for break_start, _ in break_times]
+    break_ends_so_far = list(accumulate((break_end for _, break_end in break_times), max))
+    
+    for week in range(weeks):
+        day_start = first_day_start + timedelta(weeks=week)
+        day_end = day_start + day_length
+        
+        if day_start < now:
+            continue  # Skip if in the past
+        
+        # Create 30-minute interview slots with 15-minute gaps between each
+        current_slot_start = day_start
+        
+        while current_slot_start + INTERVIEW_DURATION <= day_end:
+            current_slot_end = current_slot_start + INTERVIEW_DURATION
+            
+            # Check if this slot overlaps with a break time
+            i = bisect_left(break_starts, current_slot_end.time())
+            if i > 0 and break_ends_so_far[i - 1] > current_slot_start.time():
+                # Skip this slot as it's during a break
+                current_slot_start = current_slot_end
+                continue
+            
+            yield current_slot_start, current_slot_end
+            
+            # Move to next slot (30 minutes + 15 minute gap = 45 minutes later)
+            current_slot_start = current_slot_end + SLOT_GAP
+
+def _generate_schedule_slots(schedule, break_times, police_info, weeks=4):
+    # Generate 30-minute interview slots from a weekly schedule for the next
+    # `weeks` occurrences of its day, skipping breaks; the database skips any
+    # that overlap an existing slot of the officer's. Only needs the schedule,
+    # its (start, end) break times and the officer's police info, so it can
+    # run outside a request too. Returns how many slots were added; the
+    # caller commits.
+    now = datetime.now()
+    days_ahead = (schedule.day_of_week - now.weekday()) % 7  # Days until the next occurrence
+    if days_ahead == 0:  # If today is the day
+        # If current time is past the end time, schedule for next week
+        if now.time() >= schedule.end_time:
+            days_ahead = 7
+    
+    # Calculate the next occurrence of this day, and the working
+    # window on it; later weeks are the same window shifted by 7 days
+    next_date = now.date() + timedelta(days=days_ahead)
+    first_day_start = datetime.combine(next_date, schedule.start_time)
+    day_length = datetime.combine(next_date, schedule.end_time) - first_day_start
+    
+    # Build every slot, linked to this weekly schedule, then write them with
+    # a single executemany INSERT that checks each one for overlaps as it goes
+    new_slots = [{
+        'officer_id': schedule.officer_id,
+        'weekly_schedule_id': schedule.id,
+        'start_time': slot_start,
+        'end_time': slot_end,
+        'is_booked': False,
+        # Add location information
+        'municipality': police_info.municipality,
+        'station_name': police_info.stationName,
+        'postal_code': police_info.postalCode,
+    } for slot_start, slot_end in _candidate_slots(first_day_start, day_length, break_times, weeks, now)]
+    
+    if not new_slots:
+        return 0
+    slots_added = db.session.execute(_INSERT_SLOT_IF_FREE, new_slots).rowcount
+    logging.debug(f"Added {slots_added} of {len(new_slots)} interview slots at {police_info.stationName}")
+    return slots_added
+
 @app.route('/police/add_weekly_availability', methods=['POST'])
 @login_required
 def police_add_weekly_availability():
@@ -2095,12 +2272,8 @@ def police_add_weekly_availability():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, WeeklySchedule, AvailableTimeSlot, ScheduledBreak
-    from datetime import datetime, timedelta, time
-    import logging
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access this feature
     if not police_info or not police_info.isApproved:
@@ -2133,139 +2306,65 @@ def police_add_weekly_availability():
             flash('Start time must be before end time.', 'danger')
             return redirect(url_for('police_availability'))
         
-        # Check if this day already has a schedule
-        existing_schedule = WeeklySchedule.query.filter_by(
+        # Check if this day already has a schedule; EXISTS stops at the first match
+        has_schedule = db.session.query(WeeklySchedule.query.filter_by(
             officer_id=current_user.id,
             day_of_week=day_of_week,
             is_active=True
-        ).first()
+        ).exists()).scalar()
         
-        if existing_schedule:
-            flash(f'You already have a schedule for this day. Please delete the existing schedule first.', 'warning')
+        if has_schedule:
+            flash(_DUPLICATE_SCHEDULE_MESSAGE, 'warning')
             return redirect(url_for('police_availability'))
         
-        # Create new weekly schedule
+        # Parse the custom breaks up front; both times must be given, and
+        # unparseable pairs are logged and skipped
+        break_times = []
+        for break_start, break_end in zip(request.form.getlist('break_start[]'),
+                                          request.form.getlist('break_end[]')):
+            if break_start and break_end:
+                try:
+                    break_times.append((datetime.strptime(break_start, '%H:%M').time(),
+                                        datetime.strptime(break_end, '%H:%M').time()))
+                except ValueError as e:
+                    logging.error(f"Error adding break: {e}")
+        
+        # Create new weekly schedule; INSERT ... RETURNING hands back the
+        # persisted row, id included, without a separate unit-of-work flush
         try:
-            new_schedule = WeeklySchedule(
-                officer_id=current_user.id,
-                day_of_week=day_of_week,
-                start_time=start_time_obj,
-                end_time=end_time_obj,
-                is_active=True
-            )
-            
-            db.session.add(new_schedule)
-            db.session.flush()  # Get the ID without committing
-            
-            # Process custom breaks
-            break_starts = request.form.getlist('break_start[]')
-            break_ends = request.form.getlist('break_end[]')
-            
-            for i in range(len(break_starts)):
-                if break_starts[i] and break_ends[i]:  # Only add if both times are provided
-                    try:
-                        break_start_time = datetime.strptime(break_starts[i], '%H:%M').time()
-                        break_end_time = datetime.strptime(break_ends[i], '%H:%M').time()
-                        
-                        # Create scheduled break
-                        scheduled_break = ScheduledBreak(
-                            schedule_id=new_schedule.id,
-                            break_start_time=break_start_time,
-                            break_end_time=break_end_time
-                        )
-                        db.session.add(scheduled_break)
-                    except Exception as e:
-                        logging.error(f"Error adding break: {e}")
-                        continue
-            
-            # Generate slots for the next 4 weeks
-            slots_added = 0
-            now = datetime.now()
-            days_ahead = (day_of_week - now.weekday()) % 7  # Days until the next occurrence
-            if days_ahead == 0:  # If today is the day
-                # If current time is past the end time, schedule for next week
-                if now.time() >= end_time_obj:
-                    days_ahead = 7
-            
-            # Calculate the next occurrence of this day
-            next_date = now.date() + timedelta(days=days_ahead)
-            
-            # Create slots for the next 4 weeks
-            for week in range(4):
-                slot_date = next_date + timedelta(days=week * 7)
-                
-                # Combine date and time
-                day_start = datetime.combine(slot_date, start_time_obj)
-                day_end = datetime.combine(slot_date, end_time_obj)
-                
-                if day_start < datetime.now():
-                    continue  # Skip if in the past
-                
-                # Create 30-minute interview slots with 15-minute gaps between each
-                current_slot_start = day_start
-                interview_duration = timedelta(minutes=30)
-                gap_duration = timedelta(minutes=15)
-                
-                # Get the scheduled breaks for this weekly schedule
-                break_times = []
-                scheduled_breaks = ScheduledBreak.query.filter_by(schedule_id=new_schedule.id).all()
-                for scheduled_break in scheduled_breaks:
-                    break_times.append((scheduled_break.break_start_time, scheduled_break.break_end_time))
-                
-                while current_slot_start + interview_duration <= day_end:
-                    current_slot_end = current_slot_start + interview_duration
-                    
-                    # Check if this slot overlaps with a break time
-                    is_break_time = False
-                    for break_start, break_end in break_times:
-                        slot_start_time = current_slot_start.time()
-                        slot_end_time = current_slot_end.time()
-                        
-                        # Check for any overlap with break
-                        if (slot_start_time < break_end and slot_end_time > break_start):
-                            is_break_time = True
-                            break
-                    
-                    if is_break_time:
-                        # Skip this slot as it's during a break
-                        current_slot_start = current_slot_end
-                        continue
-                    
-                    # Check for overlapping slots
-                    overlapping_slots = AvailableTimeSlot.query.filter(
-                        AvailableTimeSlot.officer_id == current_user.id,
-                        AvailableTimeSlot.start_time < current_slot_end,
-                        AvailableTimeSlot.end_time > current_slot_start
-                    ).all()
-                    
-                    if not overlapping_slots:
-                        # Create new 30-minute interview slot linked to this weekly schedule
-                        try:
-                            new_slot = AvailableTimeSlot(
-                                officer_id=current_user.id,
-                                weekly_schedule_id=new_schedule.id,
-                                start_time=current_slot_start,
-                                end_time=current_slot_end,
-                                is_booked=False,
-                                # Add location information
-                                municipality=police_info.municipality,
-                                station_name=police_info.stationName,
-                                postal_code=police_info.postalCode
-                            )
-                            
-                            db.session.add(new_slot)
-                            slots_added += 1
-                            logging.debug(f"Added interview slot: {current_slot_start} to {current_slot_end} at {police_info.stationName}")
-                        except Exception as e:
-                            logging.error(f"Error adding slot: {e}")
-                    
-                    # Move to next slot (30 minutes + 15 minute gap = 45 minutes later)
-                    current_slot_start = current_slot_end + gap_duration
-            
+            try:
+                new_schedule = db.session.scalars(
+                    insert(WeeklySchedule).returning(WeeklySchedule),
+                    [{
+                        'officer_id': current_user.id,
+                        'day_of_week': day_of_week,
+                        'start_time': start_time_obj,
+                        'end_time': end_time_obj,
+                        'is_active': True,
+                    }]
+                ).one()
+            except IntegrityError:
+                # The only constraint this INSERT can hit is uq_weekly_sched:
+                # a concurrent request (e.g. a double-submitted form) added
+                # this day's schedule after the check above
+                db.session.rollback()
+                flash(_DUPLICATE_SCHEDULE_MESSAGE, 'warning')
+                return redirect(url_for('police_availability'))
+            
+            # Write the breaks with one executemany INSERT
+            if break_times:
+                db.session.execute(insert(ScheduledBreak), [{
+                    'schedule_id': new_schedule.id,
+                    'break_start_time': break_start,
+                    'break_end_time': break_end,
+                } for break_start, break_end in break_times])
+            
+            # Generate slots for the next 4 weeks; the breaks just entered
+            # apply to every generated day
+            slots_added = _generate_schedule_slots(new_schedule, break_times, police_info)
             db.session.commit()
             
-            days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            flash(f'Added weekly schedule for {days[day_of_week]} and generated {slots_added} interview slots.', 'success')
+            flash(f'Added weekly schedule for {DAYS_OF_WEEK[day_of_week]} and generated {slots_added} interview slots.', 'success')
             
         except Exception as e:
             logging.error(f"Database error: {e}")
@@ -2281,12 +2380,8 @@ def police_clear_availability():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import PoliceInfo, AvailableTimeSlot, WeeklySchedule
-    from datetime import datetime
-    import logging
-    
     # Get the police officer's information
-    police_info = PoliceInfo.query.filter_by(user_id=current_user.id).first()
+    police_info = current_police_info()
     
     # Police officers must be approved to access this feature
     if not police_info or not police_info.isApproved:
@@ -2300,32 +2395,62 @@ def police_clear_availability():
             AvailableTimeSlot.officer_id == current_user.id,
             AvailableTimeSlot.is_booked == False,
             AvailableTimeSlot.start_time > now
-        ).delete()
+        ).delete(synchronize_session=False)
         
         # Mark all weekly schedules as inactive
         WeeklySchedule.query.filter_by(
             officer_id=current_user.id,
             is_active=True
-        ).update({WeeklySchedule.is_active: False})
+        ).update({WeeklySchedule.is_active: False}, synchronize_session=False)
         
         db.session.commit()
         flash(f'Successfully cleared all weekly schedules and {deleted_slots} future available time slots.', 'success')
-    except:
+    except SQLAlchemyError:
+        app.logger.exception("Error clearing availability")
         db.session.rollback()
         flash('An error occurred. Please try again.', 'danger')
     
     return redirect(url_for('police_availability'))
 
 # API endpoints for officer availability and interview scheduling
+def _json_response(data):
+    # Serialise an API payload, writing datetimes as ISO 8601 strings
+    if orjson is not None:
+        body = orjson.dumps(data)
+    else:
+        body = json.dumps(data, default=datetime.isoformat)
+    return app.response_class(body, mimetype='application/json')
+
+# Open future slots at a location, one per time window, as (id, start, end)
+# tuples. Residents browsing the same station repeat this query, so results
+# are shared for up to 30 seconds and dropped whenever a slot there is booked
+@cache.memoize(timeout=30)
+def _available_slots_for_location(municipality, station_name, postal_code):
+    # Officers aren't shown before booking, so when several cover the same
+    # window the resident only needs one of them; group by window and offer
+    # the lowest slot id
+    return [tuple(row) for row in db.session.query(
+        func.min(AvailableTimeSlot.id).label('id'),
+        AvailableTimeSlot.start_time,
+        AvailableTimeSlot.end_time
+    ).filter(
+        AvailableTimeSlot.municipality == municipality,
+        AvailableTimeSlot.station_name == station_name,
+        AvailableTimeSlot.postal_code == postal_code,
+        AvailableTimeSlot.is_booked == False,
+        AvailableTimeSlot.start_time > datetime.now()
+    ).group_by(
+        AvailableTimeSlot.start_time, AvailableTimeSlot.end_time
+    ).order_by(AvailableTimeSlot.start_time)]
+
+def _location_slots_changed(slot):
+    # Call after committing a booking of `slot`
+    cache.delete_memoized(_available_slots_for_location,
+                          slot.municipality, slot.station_name, slot.postal_code)
+
 @app.route('/api/location-availability')
 @login_required
 def api_location_availability():
-    from models import AvailableTimeSlot, User
-    from datetime import datetime
-    from flask import jsonify, request
-    from sqlalchemy import func
-    import logging
-    
     # Get location parameters
     municipality = request.args.get('municipality')
     station_name = request.args.get('station')
@@ -2339,103 +2464,89 @@ def api_location_availability():
     
     # Get available slots for this location
     try:
-        available_slots = AvailableTimeSlot.query.filter(
-            AvailableTimeSlot.municipality == municipality,
-            AvailableTimeSlot.station_name == station_name,
-            AvailableTimeSlot.postal_code == postal_code,
-            AvailableTimeSlot.is_booked == False,
-            AvailableTimeSlot.start_time > datetime.now()
-        ).order_by(AvailableTimeSlot.start_time).all()
+        available_slots = _available_slots_for_location(municipality, station_name, postal_code)
         
         logging.info(f"Found {len(available_slots)} available slots for the location")
     except Exception as e:
         logging.error(f"Error querying for available slots: {str(e)}")
         return jsonify({"error": "Error fetching available slots"}), 500
     
-    slots_data = []
-    for slot in available_slots:
-        # Get minimum officer info (name is hidden until after booking)
-        officer_id = slot.officer_id
-        
-        slots_data.append({
-            'id': slot.id,
-            'start_time': slot.start_time.isoformat(),
-            'end_time': slot.end_time.isoformat(),
-            'municipality': slot.municipality,
-            'station_name': slot.station_name,
-            'postal_code': slot.postal_code
-        })
-    
-    return jsonify(slots_data)
+    # Every slot matched the requested location exactly
+    slots_data = [{
+        'id': slot_id,
+        'start_time': start_time,
+        'end_time': end_time,
+        'municipality': municipality,
+        'station_name': station_name,
+        'postal_code': postal_code
+    } for slot_id, start_time, end_time in available_slots]
+    
+    # The list is the same for every resident; let the browser reuse it for
+    # as long as the server-side copy lives. It sits behind login, so
+    # shared caches must not keep it
+    response = _json_response(slots_data)
+    response.headers['Cache-Control'] = 'private, max-age=30'
+    return response
 
 @app.route('/api/officer-availability/<int:officer_id>')
 @login_required
 def api_officer_availability(officer_id):
-    from models import AvailableTimeSlot, User, PoliceInfo
-    from datetime import datetime
-    from flask import jsonify
-    
-    # Verify the officer exists and is approved
-    officer = User.query.filter_by(id=officer_id, userType='police').first()
-    if not officer:
-        return jsonify([])
-    
-    police_info = PoliceInfo.query.filter_by(user_id=officer_id).first()
-    if not police_info or not police_info.isApproved:
-        return jsonify([])
-    
-    # Get available slots (not booked) with start time in the future
-    available_slots = AvailableTimeSlot.query.filter(
+    # Get available slots (not booked) with start time in the future. Joining
+    # the officer's user and police info rows returns nothing unless the
+    # officer exists, is police and is approved, so no separate checks are needed.
+    available_slots = db.session.query(
+        AvailableTimeSlot.id, AvailableTimeSlot.start_time, AvailableTimeSlot.end_time
+    ).join(
+        User, User.id == AvailableTimeSlot.officer_id
+    ).join(
+        PoliceInfo, PoliceInfo.user_id == User.id
+    ).filter(
         AvailableTimeSlot.officer_id == officer_id,
+        User.userType == 'police',
+        PoliceInfo.isApproved == True,
         AvailableTimeSlot.is_booked == False,
         AvailableTimeSlot.start_time > datetime.now()
     ).order_by(AvailableTimeSlot.start_time).all()
     
-    # Format slots for JSON response
-    slots_data = []
-    for slot in available_slots:
-        slots_data.append({
-            'id': slot.id,
-            'start_time': slot.start_time.isoformat(),
-            'end_time': slot.end_time.isoformat()
-        })
+    # The selected columns are exactly the response fields
+    slots_data = [slot._asdict() for slot in available_slots]
     
-    return jsonify(slots_data)
+    return _json_response(slots_data)
 
 @app.route('/api/slot-details/<int:slot_id>')
 @login_required
 def api_slot_details(slot_id):
-    from models import AvailableTimeSlot, User, PoliceInfo
-    from flask import jsonify
-    import logging
-    
     logging.info(f"API Slot Details Request - Slot ID: {slot_id}")
     
     try:
-        # Get the slot
-        slot = AvailableTimeSlot.query.get_or_404(slot_id)
-        logging.info(f"Found slot with ID {slot_id} for officer ID {slot.officer_id}")
-        
-        # Get officer details
-        officer = User.query.get(slot.officer_id)
-        if not officer:
-            logging.error(f"Officer not found for ID {slot.officer_id}")
-            return jsonify({"error": "Officer not found"}), 404
-            
-        officer_info = PoliceInfo.query.filter_by(user_id=officer.id).first()
-        if not officer_info:
-            logging.error(f"Officer information not found for user ID {officer.id}")
-            return jsonify({"error": "Officer information not found"}), 404
+        # Get the slot with its officer and their police info in one query
+        slot = db.session.get(
+            AvailableTimeSlot, slot_id,
+            options=[joinedload(AvailableTimeSlot.officer).joinedload(User.police_info)]
+        )
     except Exception as e:
         logging.error(f"Error retrieving slot or officer details: {str(e)}")
         return jsonify({"error": "Error retrieving slot details"}), 500
     
+    if not slot:
+        return jsonify({"error": "Slot not found"}), 404
+    logging.info(f"Found slot with ID {slot_id} for officer ID {slot.officer_id}")
+    
+    officer = slot.officer
+    if not officer:
+        logging.error(f"Officer not found for ID {slot.officer_id}")
+        return jsonify({"error": "Officer not found"}), 404
+    
+    if not officer.police_info:
+        logging.error(f"Officer information not found for user ID {officer.id}")
+        return jsonify({"error": "Officer information not found"}), 404
+    
     # Create response data - only use location info in initial selection
     # Officer name is intentionally removed until after booking
     slot_data = {
         'id': slot.id,
-        'start_time': slot.start_time.isoformat(),
-        'end_time': slot.end_time.isoformat(),
+        'start_time': slot.start_time,
+        'end_time': slot.end_time,
         'is_booked': slot.is_booked,
         'officer_id': officer.id,
         'station_name': slot.station_name,
@@ -2443,7 +2554,7 @@ def api_slot_details(slot_id):
         'postal_code': slot.postal_code
     }
     
-    return jsonify(slot_data)
+    return _json_response(slot_data)
 
 @app.route('/book-interview-slot', methods=['POST'])
 @login_required
@@ -2452,9 +2563,6 @@ def book_interview_slot():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import AvailableTimeSlot, AddressApplication, Appointment
-    from datetime import datetime
-    
     slot_id = request.form.get('slot_id')
     application_id = request.form.get('application_id')
     
@@ -2463,7 +2571,7 @@ def book_interview_slot():
         return redirect(url_for('resident_schedule_interview'))
     
     # Get the application
-    application = AddressApplication.query.get(application_id)
+    application = db.session.get(AddressApplication, application_id)
     if not application or application.applicant_id != current_user.id:
         flash('Application not found.', 'danger')
         return redirect(url_for('resident_schedule_interview'))
@@ -2474,20 +2582,16 @@ def book_interview_slot():
         return redirect(url_for('resident_schedule_interview'))
     
     # Get the time slot
-    time_slot = AvailableTimeSlot.query.get(slot_id)
+    time_slot = db.session.get(AvailableTimeSlot, slot_id)
     if not time_slot:
         flash('Time slot not found.', 'danger')
         return redirect(url_for('resident_schedule_interview'))
     
-    # Check if the slot is already booked
-    if time_slot.is_booked:
+    # Book the slot, unless it is already booked
+    if not _claim_slot(time_slot.id):
         flash('This time slot is no longer available.', 'danger')
         return redirect(url_for('resident_schedule_interview'))
     
-    # For testing - import needed classes
-    from models import AddressCertificate
-    import uuid
-    
     # Create an appointment
     appointment = Appointment(
         resident_id=current_user.id,
@@ -2498,26 +2602,19 @@ def book_interview_slot():
         status='completed'  # Mark as completed immediately for testing
     )
     
-    # Mark the currently selected slot as booked
-    time_slot.is_booked = True
-    
     # Also mark any slots that overlap with this one (including the 15 minutes after)
     # This ensures that when a slot is booked, that time plus 15 minutes after won't be available
-    from datetime import timedelta
-    buffer_end_time = time_slot.end_time + timedelta(minutes=15)
+    buffer_end_time = time_slot.end_time + BOOKING_BUFFER
     
-    # Find overlapping slots (slots that start during or right after this interview)
-    overlapping_slots = AvailableTimeSlot.query.filter(
+    # Mark overlapping slots (slots that start during or right after this
+    # interview) as booked with a single UPDATE
+    AvailableTimeSlot.query.filter(
         AvailableTimeSlot.officer_id == time_slot.officer_id,
         AvailableTimeSlot.id != time_slot.id,  # Exclude the current slot
         AvailableTimeSlot.is_booked == False,  # Only consider slots that aren't already booked
         AvailableTimeSlot.start_time < buffer_end_time,  # The slot starts before the buffered end time
         AvailableTimeSlot.end_time > time_slot.start_time  # The slot ends after this slot starts
-    ).all()
-    
-    # Mark all overlapping slots as booked
-    for slot in overlapping_slots:
-        slot.is_booked = True
+    ).update({AvailableTimeSlot.is_booked: True}, synchronize_session=False)
     
     # For testing: Auto-approve application (skip interview)
     application.status = 'approved'
@@ -2525,7 +2622,7 @@ def book_interview_slot():
     application.officer_notes = "Auto-approved for testing purposes"
     
     # Create a certificate immediately for testing
-    certificate_number = f"AM-{uuid.uuid4().hex[:8].upper()}"
+    certificate_number = _new_certificate_number()
     issue_date = datetime.now()
     expiry_date = issue_date + timedelta(days=365)  # Valid for 1 year
     
@@ -2541,6 +2638,7 @@ def book_interview_slot():
         db.session.add(appointment)
         db.session.add(certificate)
         db.session.commit()
+        _location_slots_changed(time_slot)
         flash('Interview scheduled and automatically approved for testing! You may now download your address certificate.', 'success')
         
         # Send notification to officer
@@ -2560,15 +2658,13 @@ def cancel_interview():
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import Appointment, AddressApplication, AvailableTimeSlot
-    
     appointment_id = request.form.get('appointment_id')
     if not appointment_id:
         flash('Missing appointment information.', 'danger')
         return redirect(url_for('resident_schedule_interview'))
     
     # Get the appointment
-    appointment = Appointment.query.get(appointment_id)
+    appointment = db.session.get(Appointment, appointment_id)
     if not appointment or appointment.resident_id != current_user.id:
         flash('Appointment not found.', 'danger')
         return redirect(url_for('resident_schedule_interview'))
@@ -2579,7 +2675,7 @@ def cancel_interview():
         return redirect(url_for('resident_schedule_interview'))
     
     # Get the application
-    application = AddressApplication.query.get(appointment.application_id)
+    application = db.session.get(AddressApplication, appointment.application_id)
     
     # Mark the appointment as cancelled
     appointment.status = 'cancelled'
@@ -2619,19 +2715,17 @@ def leader_review_application(application_id):
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import LeaderInfo, AddressApplication, ResidentInfo, User
-    
     # Get the leader's information
-    leader_info = LeaderInfo.query.filter_by(user_id=current_user.id).first()
+    leader_info = current_leader_info()
     if not leader_info or not leader_info.isApproved:
         flash('Your account is not yet verified as a leader.', 'warning')
         return redirect(url_for('leader_dashboard'))
     
     # Get the application
-    application = AddressApplication.query.get_or_404(application_id)
+    application = db.get_or_404(AddressApplication, application_id)
     
     # Get resident info
-    resident = User.query.get(application.applicant_id)
+    resident = db.session.get(User, application.applicant_id)
     resident_info = ResidentInfo.query.filter_by(user_id=resident.id).first()
     
     if request.method == 'POST':
@@ -2650,13 +2744,13 @@ def leader_review_application(application_id):
             flash('Application has been rejected.', 'info')
         
         db.session.commit()
+        _pending_applications_changed()
         return redirect(url_for('leader_dashboard'))
     
     return render_template(
         'leader/review_application.html',
         application=application,
-        resident_info=resident_info,
-        pending_applications_count=AddressApplication.query.filter_by(status='pending').count()
+        resident_info=resident_info
     )
 
 @app.route('/resident/schedule/<int:application_id>', methods=['GET', 'POST'])
@@ -2666,11 +2760,8 @@ def schedule_interview(application_id):
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import AddressApplication, PoliceInfo, User, Appointment, AvailableTimeSlot
-    from datetime import datetime, timedelta
-    
     # Get the application
-    application = AddressApplication.query.get_or_404(application_id)
+    application = db.get_or_404(AddressApplication, application_id)
     if application.applicant_id != current_user.id:
         flash('Access denied.', 'danger')
         return redirect(url_for('resident_dashboard'))
@@ -2679,38 +2770,39 @@ def schedule_interview(application_id):
         flash('Your application is not ready for interview scheduling.', 'warning')
         return redirect(url_for('resident_dashboard'))
     
-    # Get available officers
-    officers = User.query.join(PoliceInfo).filter(PoliceInfo.isApproved == True).all()
-    
-    # For demo purposes, create some available time slots if none exist
-    available_slots = AvailableTimeSlot.query.filter_by(is_booked=False).all()
-    if not available_slots and officers:
+    # For demo purposes, create some available time slots for the first
+    # approved officer if none exist
+    has_open_slot = db.session.query(
+        AvailableTimeSlot.query.filter_by(is_booked=False).exists()
+    ).scalar()
+    officer_id = None if has_open_slot else db.session.scalar(
+        select(User.id).join(PoliceInfo).where(PoliceInfo.isApproved == True).limit(1)
+    )
+    if officer_id:
         # Create mock time slots for the next 7 days
         start_date = datetime.now() + timedelta(days=1)  # Start tomorrow
+        mock_slots = []
         for day in range(7):
             slot_date = start_date + timedelta(days=day)
             for hour in [9, 11, 13, 15]:  # 9am, 11am, 1pm, 3pm
                 slot_time = datetime.combine(slot_date.date(), datetime.min.time()) + timedelta(hours=hour)
-                new_slot = AvailableTimeSlot(
-                    officer_id=officers[0].id,
-                    start_time=slot_time,
-                    end_time=slot_time + timedelta(minutes=30),
-                    is_booked=False
-                )
-                db.session.add(new_slot)
+                mock_slots.append({
+                    'officer_id': officer_id,
+                    'start_time': slot_time,
+                    'end_time': slot_time + INTERVIEW_DURATION,
+                    'is_booked': False,
+                })
+        db.session.execute(insert(AvailableTimeSlot), mock_slots)
         db.session.commit()
-        available_slots = AvailableTimeSlot.query.filter_by(is_booked=False).all()
     
     if request.method == 'POST':
         slot_id = request.form.get('time_slot')
         if not slot_id:
             flash('Please select a time slot.', 'danger')
         else:
-            slot = AvailableTimeSlot.query.get(slot_id)
-            if slot and not slot.is_booked:
-                # Book the slot
-                slot.is_booked = True
-                
+            slot = db.session.get(AvailableTimeSlot, slot_id)
+            # Book the slot, unless it is already booked
+            if slot and _claim_slot(slot.id):
                 # Create appointment
                 appointment = Appointment(
                     resident_id=current_user.id,
@@ -2727,22 +2819,30 @@ def schedule_interview(application_id):
                 
                 db.session.add(appointment)
                 db.session.commit()
+                _location_slots_changed(slot)
                 
                 flash('Interview successfully scheduled.', 'success')
                 return redirect(url_for('resident_dashboard'))
             else:
                 flash('The selected time slot is no longer available.', 'danger')
     
-    # Group slots by date for display
-    grouped_slots = {}
-    for slot in available_slots:
-        date_str = slot.start_time.strftime('%Y-%m-%d')
-        if date_str not in grouped_slots:
-            grouped_slots[date_str] = []
-        grouped_slots[date_str].append(slot)
+    # Future open slots, only the columns the page shows, already in date order
+    available_slots = db.session.query(
+        AvailableTimeSlot.id,
+        AvailableTimeSlot.start_time,
+        AvailableTimeSlot.end_time,
+        AvailableTimeSlot.officer_id
+    ).filter(
+        AvailableTimeSlot.is_booked == False,
+        AvailableTimeSlot.start_time > datetime.now()
+    ).order_by(AvailableTimeSlot.start_time).all()
     
-    # Sort dates
-    sorted_dates = sorted(grouped_slots.keys())
+    # Group slots by date for display; the rows are sorted, so the dates are too
+    grouped_slots = {
+        date_str: list(slots)
+        for date_str, slots in groupby(available_slots, key=lambda slot: slot.start_time.strftime('%Y-%m-%d'))
+    }
+    sorted_dates = list(grouped_slots)
     
     return render_template(
         'resident/schedule_interview.html',
@@ -2758,17 +2858,15 @@ def conduct_interview(appointment_id):
         flash('Access denied.', 'danger')
         return redirect(url_for('index'))
     
-    from models import Appointment, AddressApplication, ResidentInfo, User
-    
     # Get the appointment
-    appointment = Appointment.query.get_or_404(appointment_id)
+    appointment = db.get_or_404(Appointment, appointment_id)
     if appointment.officer_id != current_user.id:
         flash('Access denied.', 'danger')
         return redirect(url_for('police_dashboard'))
     
     # Get application and resident info
-    application = AddressApplication.query.get(appointment.application_id)
-    resident = User.query.get(appointment.resident_id)
+    application = db.session.get(AddressApplication, appointment.application_id)
+    resident = db.session.get(User, appointment.resident_id)
     resident_info = ResidentInfo.query.filter_by(user_id=resident.id).first()
     
     if request.method == 'POST':
@@ -2785,11 +2883,7 @@ def conduct_interview(appointment_id):
             application.officer_notes = officer_notes
             
             # Create a certificate
-            from models import AddressCertificate
-            from datetime import datetime, timedelta
-            import uuid
-            
-            certificate_number = f"AM-{uuid.uuid4().hex[:8].upper()}"
+            certificate_number = _new_certificate_number()
             issue_date = datetime.now()
             expiry_date = issue_date + timedelta(days=365)  # Valid for 1 year
             
@@ -2838,7 +2932,6 @@ def conduct_interview(appointment_id):
 
 # Create database tables
 with app.app_context():
-    import models  # Import to register models
     db.create_all()
     logging.info("Database tables created (or ensured they exist)")
 
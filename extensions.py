@@ -0,0 +1,15 @@
+from flask_caching import Cache
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import DeclarativeBase
+
+# Database setup
+class Base(DeclarativeBase):
+    pass
+
+# Bound to the Flask app in app.py; lives here so models.py can import db
+# without importing app
+db = SQLAlchemy(model_class=Base)
+
+# Small shared cache for values that may be a few seconds stale (the leader
+# pending-applications badge); configured in app.py
+cache = Cache()
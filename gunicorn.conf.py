@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for serving AddressMe in production.
+
+Run with: gunicorn -c gunicorn.conf.py main:application
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', 5000)}")
+
+# SQLite allows one writer at a time, so use plain sync workers with a
+# single thread each: at most `workers` requests are in flight, and busy
+# writers wait on busy_timeout instead of contending inside a process
+worker_class = 'sync'
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+threads = 1
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
@@ -34,6 +34,14 @@ def run_migration():
         #     print("Columns already exist, no migration needed.")
         print("For SQLite, ensure db.create_all() in app.py handles initial table creation.")
         print("Migration script adjusted for SQLite. No specific column alterations performed by default.")
+        
+        # db.create_all() skips tables that already exist, so indexes added to
+        # the models later are never created on an existing database. Create
+        # any that are missing.
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=db.engine, checkfirst=True)
+                print(f"Ensured index {index.name} on {table.name}")
 
 if __name__ == "__main__":
     run_migration()
\ No newline at end of file
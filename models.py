@@ -1,18 +1,18 @@
 from datetime import datetime
 from flask_login import UserMixin
-from app import db
+from extensions import db
 
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     fullName = db.Column(db.String(100), nullable=False)
-    email = db.Column(db.String(100), unique=True, nullable=False)
+    email = db.Column(db.String(100), unique=True, index=True, nullable=False)
     password = db.Column(db.String(200), nullable=False)
     userType = db.Column(db.String(20), nullable=False)  # resident, leader, police
     isVerified = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Relationships
-    resident_info = db.relationship('ResidentInfo', backref='user', uselist=True, lazy='dynamic',
+    resident_info = db.relationship('ResidentInfo', backref='user', uselist=False, lazy='joined',
                                   foreign_keys='ResidentInfo.user_id')
     leader_info = db.relationship('LeaderInfo', backref='user', uselist=False, lazy=True)
     police_info = db.relationship('PoliceInfo', backref='user', uselist=False, lazy=True)
@@ -42,6 +42,11 @@ class ResidentInfo(db.Model):
     idPhotoPath = db.Column(db.String(200))  # Path to stored ID photo
     facePhotoPath = db.Column(db.String(200))  # Path to stored face photo
     
+    # Leader pages look up the residents of their municipality and ward
+    __table_args__ = (
+        db.Index('ix_resident_muni_ward', 'municipality', 'wardNumber'),
+    )
+    
     def __repr__(self):
         return f'<ResidentInfo {self.firstName} {self.lastName}>'
 
@@ -88,6 +93,9 @@ class PoliceInfo(db.Model):
 
 
 # Status options: "pending", "leader_approved", "interview_scheduled", "interview_completed", "approved", "rejected"
+# Statuses of an application that is still in progress
+PENDING_STATUSES = ('pending', 'leader_approved', 'interview_scheduled', 'interview_completed')
+
 class AddressApplication(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     applicant_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -103,6 +111,21 @@ class AddressApplication(db.Model):
     leader = db.relationship('User', foreign_keys=[leader_id], backref='leader_applications')
     officer = db.relationship('User', foreign_keys=[officer_id], backref='officer_applications')
     
+    # Leader dashboard counts group this leader's applications by status;
+    # the leader application list filters by status and pages by created_at.
+    # Police pages filter by status and assigned officer.
+    # Resident pages look up their own applications by status, newest first,
+    # and check for an in-progress one on most requests.
+    __table_args__ = (
+        db.Index('ix_app_leader_status', 'leader_id', 'status'),
+        db.Index('ix_app_status_created', 'status', 'created_at'),
+        db.Index('ix_app_status_officer', 'status', 'officer_id'),
+        db.Index('ix_app_applicant_status_updated', applicant_id, status, updated_at.desc()),
+        db.Index('ix_app_applicant_pending', applicant_id, created_at.desc(),
+                 sqlite_where=status.in_(PENDING_STATUSES),
+                 postgresql_where=status.in_(PENDING_STATUSES)),
+    )
+    
     def __repr__(self):
         return f'<AddressApplication {self.id}>'
 
@@ -123,6 +146,11 @@ class Appointment(db.Model):
     officer = db.relationship('User', foreign_keys=[officer_id], backref='officer_appointments')
     application = db.relationship('AddressApplication', backref='appointment')
     
+    # Officer dashboards and appointment lists filter by officer and date range
+    __table_args__ = (
+        db.Index('ix_appt_officer_date', 'officer_id', 'appointment_date'),
+    )
+    
     def __repr__(self):
         return f'<Appointment {self.id}>'
 
@@ -140,6 +168,13 @@ class WeeklySchedule(db.Model):
     # Relationship
     officer = db.relationship('User', backref='weekly_schedules')
     breaks = db.relationship('ScheduledBreak', backref='schedule', cascade="all, delete-orphan")
+    
+    # An officer has at most one active schedule per day. Deleted schedules
+    # are only deactivated, so the constraint covers active rows alone
+    __table_args__ = (
+        db.Index('uq_weekly_sched', 'officer_id', 'day_of_week', unique=True,
+                 sqlite_where=is_active == True, postgresql_where=is_active == True),
+    )
 
 # For storing configured breaks within a weekly schedule
 class ScheduledBreak(db.Model):
@@ -170,6 +205,23 @@ class AvailableTimeSlot(db.Model):
     officer = db.relationship('User', backref='available_slots')
     weekly_schedule = db.relationship('WeeklySchedule', backref='generated_slots')
     
+    # Location-based slot search filters on all of these, then orders by start_time
+    # ix_slot_open_start only covers unbooked slots, for the "future, open" scans
+    # ix_slot_officer_time answers the per-officer overlap check from the index alone
+    # ix_slot_officer_booked_start serves an officer's open slots by time (the
+    # availability API, clearing availability, and booking)
+    # uq_slot_officer_open_start backs up the overlap check on slot generation:
+    # an officer can't have two open slots starting at the same time
+    __table_args__ = (
+        db.Index('ix_slot_loc_avail', 'municipality', 'station_name', 'postal_code', 'is_booked', 'start_time'),
+        db.Index('ix_slot_officer_time', 'officer_id', 'start_time', 'end_time'),
+        db.Index('ix_slot_officer_booked_start', 'officer_id', 'is_booked', 'start_time'),
+        db.Index('ix_slot_open_start', 'start_time',
+                 sqlite_where=is_booked == False, postgresql_where=is_booked == False),
+        db.Index('uq_slot_officer_open_start', 'officer_id', 'start_time', unique=True,
+                 sqlite_where=is_booked == False, postgresql_where=is_booked == False),
+    )
+    
     def __repr__(self):
         return f'<AvailableTimeSlot {self.start_time}>'
 